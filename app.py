@@ -7,13 +7,14 @@ from pathlib import Path
 from typing import Any, Callable, Dict, Mapping, MutableMapping, Optional
 
 from flask import Flask, jsonify, render_template, request, session, g, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 
 from sqlalchemy import text
 
 from core.article_fetcher import SougouWeChatFetcher
 from core.bid_extractor import BidInfoExtractor
 from core.data_manager import DataManager
-from core.database import init_db
+from core.database import init_db, session_scope
 from core.notification import EmailNotificationService
 from core.scheduler import CrawlScheduler, SchedulerConfig
 from core.scraper import WeChatArticleScraper
@@ -24,6 +25,11 @@ from models.wechat_account import WeChatAccount
 from core.auth_manager import AuthManager
 from models.user import User
 
+try:  # orjson serialises API responses several times faster than the stdlib encoder
+    import orjson
+except ImportError:  # pragma: no cover - keep Flask's default provider
+    orjson = None
+
 StatusDict = MutableMapping[str, Any]
 StatusUpdater = Callable[..., None]
 Executor = Callable[[Callable[[], None]], Any]
@@ -33,6 +39,25 @@ def _load_config(path: Path) -> Dict[str, Any]:
     return load_config(path)
 
 
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson; Flask's ``default`` still formats dates and the like."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # Datetimes are passed through to Flask's default so they keep the HTTP-date format.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)  # e.g. integers beyond 64 bits
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 class CrawlRunner:
     """Encapsulate the full crawl workflow so it can be triggered from the web layer."""
 
@@ -247,6 +272,8 @@ def create_app(
         template_folder="web/templates",
         static_folder="web/static",
     )
+    if orjson is not None:
+        app.json = OrjsonJSONProvider(app)
 
     app.config["DB_READY"] = db_ready
     app.secret_key = config_data.get("secret_key", "dev-secret-key-change-in-prod")
@@ -468,9 +495,8 @@ def create_app(
         }
     )
 
-    def _db_session():
-        factory = app.config.get("DB_SESSION_FACTORY")
-        return factory() if factory else None
+    def _db_session_scope():
+        return session_scope(app.config["DB_SESSION_FACTORY"])
 
     @app.route("/")
     def index():
@@ -620,12 +646,8 @@ def create_app(
     @app.get("/api/sources/wechat")
     def get_wechat_accounts():
         """List all WeChat accounts."""
-        session = _db_session()
-        try:
-            accounts = WeChatAccount.get_all(session)
-            data = [account.to_dict() for account in accounts]
-        finally:
-            session.close()
+        with _db_session_scope() as session:
+            data = [account.to_dict() for account in WeChatAccount.get_all(session)]
         return jsonify({"success": True, "data": data})
     
     @app.post("/api/sources/wechat")
@@ -636,8 +658,7 @@ def create_app(
             if not account or not account.get("name"):
                 return jsonify({"success": False, "message": "账号名称不能为空"}), 400
             
-            session = _db_session()
-            try:
+            with _db_session_scope() as session:
                 if not account.get("id"):
                     account["id"] = _generate_account_id(account["name"])
                 if WeChatAccount.get_by_id(session, account["id"]):
@@ -658,8 +679,6 @@ def create_app(
 
                 created = WeChatAccount.create(session, account)
                 payload = created.to_dict()
-            finally:
-                session.close()
             return jsonify({"success": True, "data": payload})
         except Exception as exc:
             logger.error("Failed to create account: %s", exc, exc_info=True)
@@ -673,8 +692,7 @@ def create_app(
             if not updated_account:
                 return jsonify({"success": False, "message": "无效数据"}), 400
 
-            session = _db_session()
-            try:
+            with _db_session_scope() as session:
                 # Check if account exists first
                 existing = WeChatAccount.get_by_id(session, account_id)
                 if not existing:
@@ -701,8 +719,6 @@ def create_app(
                 if not updated:
                     return jsonify({"success": False, "message": "账号不存在"}), 404
                 payload = updated.to_dict()
-            finally:
-                session.close()
             return jsonify({"success": True, "data": payload})
         except Exception as exc:
             logger.error("Failed to update account: %s", exc, exc_info=True)
@@ -712,11 +728,8 @@ def create_app(
     def delete_wechat_account(account_id):
         """Delete a WeChat account."""
         try:
-            session = _db_session()
-            try:
+            with _db_session_scope() as session:
                 deleted = WeChatAccount.delete(session, account_id)
-            finally:
-                session.close()
             if not deleted:
                 return jsonify({"success": False, "message": "账号不存在"}), 404
             return jsonify({"success": True, "message": "已删除"})
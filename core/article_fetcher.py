@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import random
+import re
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -55,6 +56,7 @@ class SougouWeChatFetcher:
         )
         self.page_size = max(1, int(wechat_cfg.get("page_size", 5) or 5))
         self.article_limit = int(wechat_cfg.get("article_limit", 10) or 10)
+        self.days_limit = int(wechat_cfg.get("days_limit", 0) or 0)
 
         # New: Filtering logic
         self.keyword_logic = str(wechat_cfg.get("filter_keyword_logic", "OR")).upper()
@@ -104,6 +106,16 @@ class SougouWeChatFetcher:
     def _load_config(self, path: Path) -> Mapping[str, Any]:
         return load_config(path)
 
+    @property
+    def keyword_filters(self) -> List[str]:
+        return self._keyword_filters
+
+    @keyword_filters.setter
+    def keyword_filters(self, keywords: List[str]) -> None:
+        # Recompile on every assignment so the matcher can never go stale.
+        self._keyword_filters = list(keywords)
+        self._keyword_pattern = self._compile_keywords(self._keyword_filters)
+
     def fetch_article_list(self, max_articles: Optional[int] = None) -> List[ArticleData]:
         """
         Return article metadata filtered by keywords.
@@ -119,6 +131,12 @@ class SougouWeChatFetcher:
 
         articles: List[ArticleData] = []
         begin = 0
+        # Compare raw create_time epochs against one precomputed cutoff so discarded
+        # articles never pay for datetime conversion.
+        cutoff_ts = int(time.time()) - self.days_limit * 86400 if self.days_limit > 0 else None
+        reached_cutoff = False
+        # Offsets shift when new posts are published mid-crawl, so pages can overlap.
+        seen_urls: set[str] = set()
 
         self.logger.info(
             "Fetching articles via WeChat API. account=%s max=%d",
@@ -136,17 +154,30 @@ class SougouWeChatFetcher:
                 break
 
             for item in items:
+                created = item.get("create_time")
+                if (
+                    cutoff_ts is not None
+                    and isinstance(created, (int, float))
+                    and created < cutoff_ts
+                ):
+                    # The list is newest-first, so everything after this is older too.
+                    reached_cutoff = True
+                    break
+
                 # Check keyword filter
                 if not self._match_keywords(item.get("title", "")):
                     continue
 
                 article = self._normalize_article(item)
-                if not article:
+                if not article or article["url"] in seen_urls:
                     continue
+                seen_urls.add(article["url"])
                 articles.append(article)
                 if len(articles) >= limit:
                     break
 
+            if reached_cutoff:
+                break
             begin += self.page_size
             self._random_delay()
 
@@ -262,8 +293,13 @@ class SougouWeChatFetcher:
              # All keywords must be present
              return all(keyword in normalized for keyword in self.keyword_filters)
         
-        # Default OR: Any keyword matches
-        return any(keyword in normalized for keyword in self.keyword_filters)
+        # Default OR: Any keyword matches, checked in one pass over the title
+        return self._keyword_pattern.search(normalized) is not None
+
+    @staticmethod
+    def _compile_keywords(keywords: Sequence[str]) -> re.Pattern:
+        """Combine the keywords into a single alternation used for OR matching."""
+        return re.compile("|".join(map(re.escape, keywords)))
 
     def _random_delay(self) -> None:
         start, end = self.request_interval_range
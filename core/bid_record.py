@@ -1,7 +1,7 @@
 from dataclasses import asdict, dataclass
 from typing import Dict
 
-@dataclass
+@dataclass(slots=True)
 class BidInfo:
     """Structured representation of a single bid announcement."""
 
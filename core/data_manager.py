@@ -1,6 +1,9 @@
+import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Set
+
+from sqlalchemy import select
 
 from models.article_record import ArticleRecord
 from models.bid_record import BidRecord
@@ -18,6 +21,8 @@ class DataManager:
         *,
         config: Optional[Mapping[str, Any]] = None,
         db_session_factory: Optional[Callable[[], Any]] = None,
+        storage: Optional[FileStorage] = None,
+        logger: Optional[logging.Logger] = None,
     ) -> None:
         self.config_path = Path(config_file)
         self.config = dict(config) if config else load_config(self.config_path)
@@ -33,10 +38,14 @@ class DataManager:
         self.articles_file = self.data_dir / "articles.json"
         self.bids_file = self.data_dir / "bids.json"
 
-        self.logger = setup_logger(self.__class__.__name__, log_dir=self.log_dir)
-        self.storage = FileStorage(logger=self.logger)
+        self.logger = logger or setup_logger(self.__class__.__name__, log_dir=self.log_dir)
+        self.storage = storage or FileStorage(logger=self.logger)
         self.db_session_factory = db_session_factory
         self.use_db = bool(self.db_session_factory)
+        # URLs in articles.json, valid while storage.cache_key() is unchanged so writes
+        # from other DataManager instances sharing the file invalidate it.
+        self._article_urls: Set[str] = set()
+        self._article_urls_key: Optional[Hashable] = None
 
     def save_bids(self, bids: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
         """Persist bids to disk, returning only the newly added entries."""
@@ -75,9 +84,14 @@ class DataManager:
             finally:
                 session.close()
 
-        bids = self.storage.load_json(self.bids_file)
         if status:
-            bids = [bid for bid in bids if bid.get("status") == status]
+            bids = list(
+                self.storage.load_json_stream(
+                    self.bids_file, lambda bid: bid.get("status") == status
+                )
+            )
+        else:
+            bids = self.storage.load_json(self.bids_file)
         bids.sort(key=lambda b: b.get("extracted_time", ""), reverse=True)
         return bids
 
@@ -115,6 +129,47 @@ class DataManager:
             self.logger.info("Updated bid %s status -> %s", bid_id, new_status)
         return updated
 
+    def update_bid_statuses(self, bid_ids: Iterable[str], new_status: str) -> int:
+        """Update the status of several bids at once, returning how many changed."""
+        ids = {str(bid_id).strip() for bid_id in bid_ids if bid_id and str(bid_id).strip()}
+        if not ids:
+            return 0
+
+        if self.use_db:
+            session = self._session()
+            try:
+                updated = (
+                    session.query(BidRecord)
+                    .filter(BidRecord.id.in_(ids))
+                    .update(
+                        {"status": new_status, "updated_time": self._timestamp()},
+                        synchronize_session=False,
+                    )
+                )
+                session.commit()
+                self.logger.info("Updated %d bid(s) status -> %s", updated, new_status)
+                return updated
+            except Exception as exc:
+                session.rollback()
+                self.logger.error("Failed to update %d bid(s): %s", len(ids), exc)
+                return 0
+            finally:
+                session.close()
+
+        bids = self.storage.load_json(self.bids_file)
+        timestamp = self._timestamp()
+        updated = 0
+        for bid in bids:
+            if bid.get("id") in ids:
+                bid["status"] = new_status
+                bid["updated_time"] = timestamp
+                updated += 1
+
+        if updated:
+            self.storage.save_json(self.bids_file, bids)
+            self.logger.info("Updated %d bid(s) status -> %s", updated, new_status)
+        return updated
+
     def is_article_crawled(self, url: str) -> bool:
         """Return True when the URL already exists in stored articles."""
         if not url:
@@ -132,8 +187,7 @@ class DataManager:
             finally:
                 session.close()
 
-        articles = self.storage.load_json(self.articles_file)
-        return any(article.get("url") == url for article in articles)
+        return url in self._known_article_urls()
 
     def save_article(self, article_data: Mapping[str, Any]) -> bool:
         """Persist article metadata if not already recorded."""
@@ -173,13 +227,17 @@ class DataManager:
             finally:
                 session.close()
 
-        articles = self.storage.load_json(self.articles_file)
-        if any(article.get("url") == url for article in articles):
+        known_urls = self._known_article_urls()
+        if url in known_urls:
             return False
 
+        articles = self.storage.load_json(self.articles_file)
         articles.append(record)
         saved = self.storage.save_json(self.articles_file, articles)
         if saved:
+            known_urls.add(url)
+            self._article_urls = known_urls
+            self._article_urls_key = self.storage.cache_key(self.articles_file)
             self.logger.info("Saved article meta: %s", url)
         return saved
 
@@ -266,6 +324,16 @@ class DataManager:
             self.logger.error("Failed to clear JSON files: %s", exc)
             return False
 
+    def _known_article_urls(self) -> Set[str]:
+        key = self.storage.cache_key(self.articles_file)
+        if key is None:
+            return set()
+        if key != self._article_urls_key:
+            articles = self.storage.load_json(self.articles_file)
+            self._article_urls = {article.get("url") for article in articles}
+            self._article_urls_key = key
+        return self._article_urls
+
     @staticmethod
     def _with_defaults(bid: Mapping[str, Any]) -> Dict[str, Any]:
         record = dict(bid)
@@ -290,19 +358,27 @@ class DataManager:
         return self.db_session_factory()
 
     def _save_bids_db(self, bids: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        payloads: Dict[str, Mapping[str, Any]] = {}
+        for bid in bids:
+            bid_id = bid.get("id")
+            if bid_id and bid_id not in payloads:
+                payloads[bid_id] = bid
+        if not payloads:
+            return []
+
         session = self._session()
         new_records: List[BidRecord] = []
         try:
-            for bid in bids:
-                bid_id = bid.get("id")
-                if not bid_id:
-                    continue
-                if session.get(BidRecord, bid_id):
-                    continue
-                payload = self._with_defaults(bid)
-                record = BidRecord.from_mapping(payload)
-                session.add(record)
-                new_records.append(record)
+            # One IN query replaces a primary-key lookup per bid.
+            existing_ids = set(
+                session.scalars(select(BidRecord.id).where(BidRecord.id.in_(payloads)))
+            )
+            new_records = [
+                BidRecord.from_mapping(self._with_defaults(bid))
+                for bid_id, bid in payloads.items()
+                if bid_id not in existing_ids
+            ]
+            session.add_all(new_records)
             if new_records:
                 session.commit()
                 self.logger.info("Saved %d new bid(s) to database.", len(new_records))
@@ -3,16 +3,91 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, insert, make_url, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 Base = declarative_base()
 
 
+def utcnow() -> datetime:
+    """
+    Naive UTC timestamp for DateTime columns (``datetime.utcnow`` is deprecated).
+
+    Timestamp columns pair ``default=utcnow`` with ``server_default=func.now()``: the
+    Python-side default stays authoritative for tables created before the server
+    defaults existed, and the server default covers rows inserted outside the ORM.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _tuple_getter(fields: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    # attrgetter returns a bare value for a single name; always hand back a tuple.
+    if len(fields) == 1:
+        get_one = attrgetter(fields[0])
+        return lambda obj: (get_one(obj),)
+    if not fields:
+        return lambda obj: ()
+    return attrgetter(*fields)
+
+
+class DictFieldsMixin:
+    """
+    Build ``to_dict`` from field tuples declared on the model.
+
+    ``_dict_fields`` are copied as stored; ``_dict_text_fields`` are optional text
+    columns rendered as "" when NULL. Each group is read with one attrgetter call
+    rather than a getattr per key.
+    """
+
+    _dict_fields: Tuple[str, ...] = ()
+    _dict_text_fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._dict_getters = (_tuple_getter(cls._dict_fields), _tuple_getter(cls._dict_text_fields))
+
+    def to_dict(self) -> Dict[str, Any]:
+        get_fields, get_text = self._dict_getters
+        data = dict(zip(self._dict_fields, get_fields(self)))
+        data.update(zip(self._dict_text_fields, [value or "" for value in get_text(self)]))
+        return data
+
+
+class BulkInsertMixin:
+    """Insert many rows with a single executemany and one commit."""
+
+    @classmethod
+    def bulk_create(cls, session: Session, items: Iterable[Mapping[str, Any]]) -> int:
+        """Insert all ``items`` at once and return the number of rows written."""
+        mappings = [cls._column_values(cls._record_from_payload(item)) for item in items]
+        if not mappings:
+            return 0
+        session.execute(insert(cls), mappings)
+        session.commit()
+        return len(mappings)
+
+    @classmethod
+    def _record_from_payload(cls, payload: Mapping[str, Any]):
+        return cls.from_mapping(payload)
+
+    @classmethod
+    def _column_values(cls, record) -> Dict[str, Any]:
+        # Leave unset columns out so their Python-side defaults still apply.
+        values = {}
+        for column in cls.__table__.columns:
+            value = getattr(record, column.key)
+            if value is not None:
+                values[column.key] = value
+        return values
+
+
 class Database:
     """Database connection manager."""
     
@@ -51,11 +126,16 @@ class Database:
             }
             
             if conn_str.startswith("sqlite"):
-                engine_kwargs["poolclass"] = NullPool
+                # An in-memory database lives inside one connection, so every
+                # checkout must share it; file databases need no pooling.
+                in_memory = make_url(conn_str).database in (None, "", ":memory:")
+                engine_kwargs["poolclass"] = StaticPool if in_memory else NullPool
                 engine_kwargs["connect_args"] = {"check_same_thread": False}
             else:
                 engine_kwargs["pool_size"] = int(db_config.get("pool_size", 5))
                 engine_kwargs["max_overflow"] = int(db_config.get("max_overflow", 10))
+                # Recycle pooled connections before server-side idle timeouts drop them.
+                engine_kwargs["pool_recycle"] = int(db_config.get("pool_recycle", 3600))
             
             self._engine = create_engine(conn_str, **engine_kwargs)
         
@@ -67,7 +147,9 @@ class Database:
             self._session_factory = sessionmaker(
                 bind=self.get_engine(),
                 autocommit=False,
-                autoflush=False
+                autoflush=False,
+                # Committed objects stay readable without a follow-up SELECT.
+                expire_on_commit=False,
             )
         return self._session_factory
     
@@ -117,6 +199,24 @@ class Database:
             return False
 
 
+@contextmanager
+def session_scope(session_factory: Callable[[], Session]) -> Iterator[Session]:
+    """
+    Yield a session that is rolled back on error and always closed on exit.
+
+    Sessions should be scoped to one unit of work (a request or a batch); do not
+    keep one open across the crawl loop, or it pins a pooled connection.
+    """
+    session = session_factory()
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 # Global database instance (initialized by app)
 _db: Optional[Database] = None
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from typing import Any
 
 DEFAULT_CONFIG = {
     "wechat": {
@@ -42,6 +42,9 @@ DEFAULT_CONFIG = {
         "retry_count": 3,
         "retry_delay": 5,
         "random_delay_range": [2, 5],
+        "static_fetch": True,
+        "request_timeout": 10,
+        "max_workers": 1,
     },
     "paths": {
         "data_dir": "data",
@@ -61,4 +64,14 @@ DEFAULT_CONFIG = {
 
 
 def default_config_copy() -> dict:
-    return deepcopy(DEFAULT_CONFIG)
+    return _clone(DEFAULT_CONFIG)
+
+
+def _clone(value: Any) -> Any:
+    # The defaults are plain dicts, lists and immutable scalars, so a direct walk does
+    # what deepcopy would without its memo bookkeeping and per-object dispatch.
+    if type(value) is dict:
+        return {key: _clone(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_clone(item) for item in value]
+    return value
@@ -81,13 +81,18 @@ class MultiSourceCrawler:
         max_articles: int
     ) -> List[Dict[str, Any]]:
         """Fetch articles from a single account."""
+        page_size = int(account.get("page_size", 5) or 5)
+        if max_articles and max_articles > 0:
+            # Never request a bigger page than the number of articles we keep.
+            page_size = min(page_size, max_articles)
+
         account_config = dict(self.config)
         account_config["wechat"] = {
             **self.config.get("wechat", {}),
             "fakeid": account.get("fakeid", ""),
             "token": account.get("token", ""),
             "cookie": account.get("cookie", ""),
-            "page_size": account.get("page_size", 5),
+            "page_size": page_size,
             "article_limit": account.get("article_limit", 10),
             "filter_keywords": account.get("filter_keywords"),
             "filter_keyword_logic": account.get("filter_keyword_logic"),
@@ -5,15 +5,23 @@ from __future__ import annotations
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from html import escape
 from pathlib import Path
-from typing import Iterable, List, Mapping, MutableMapping, Optional, Sequence
+from typing import Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 
 from utils.config_loader import load_config
 from utils.logger import setup_logger
 
 BidRecord = Mapping[str, object]
 
+# Same replacements as html.escape(quote=True), applied in a single translate pass.
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+
+def _esc(value: str) -> str:
+    return value.translate(_HTML_ESCAPE_TABLE)
+
 
 class SMTPConfigurationError(ValueError):
     """Raised when the email configuration is incomplete."""
@@ -22,6 +30,15 @@ class SMTPConfigurationError(ValueError):
 class EmailNotificationService:
     """Send HTML emails when new bids are available."""
 
+    _FIELD_LABELS: Tuple[Tuple[str, str], ...] = (
+        ("预算金额", "budget"),
+        ("采购人", "purchaser"),
+        ("获取文件时间", "doc_time"),
+        ("项目编号", "project_number"),
+        ("服务期限", "service_period"),
+        ("采购内容", "content"),
+    )
+
     def __init__(
         self,
         config_path: str | Path = "config.yml",
@@ -101,22 +118,35 @@ class EmailNotificationService:
             return False
 
         if data_manager:
-            updated = 0
-            for bid in bid_list:
-                bid_id = str(bid.get("id") or "").strip()
-                if not bid_id:
-                    continue
-                try:
-                    if data_manager.update_bid_status(bid_id, "notified"):
-                        updated += 1
-                except Exception as exc:  # pragma: no cover - defensive logging
-                    self.logger.error(
-                        "Failed to update bid %s status to 'notified': %s", bid_id, exc
-                    )
+            bid_ids = [str(bid.get("id") or "").strip() for bid in bid_list]
+            bid_ids = [bid_id for bid_id in bid_ids if bid_id]
+            updated = self._mark_notified(bid_ids, data_manager)
             if updated:
                 self.logger.info("Updated %d bid(s) status to 'notified'.", updated)
         return True
 
+    def _mark_notified(self, bid_ids: Sequence[str], data_manager) -> int:
+        if not bid_ids:
+            return 0
+        bulk_update = getattr(data_manager, "update_bid_statuses", None)
+        if bulk_update is not None:
+            try:
+                return int(bulk_update(bid_ids, "notified") or 0)
+            except Exception as exc:  # pragma: no cover - defensive logging
+                self.logger.error("Failed to update bid statuses to 'notified': %s", exc)
+                return 0
+
+        updated = 0
+        for bid_id in bid_ids:
+            try:
+                if data_manager.update_bid_status(bid_id, "notified"):
+                    updated += 1
+            except Exception as exc:  # pragma: no cover - defensive logging
+                self.logger.error(
+                    "Failed to update bid %s status to 'notified': %s", bid_id, exc
+                )
+        return updated
+
     def send_test_email(self) -> bool:
         """Send a sample email to verify SMTP credentials."""
         sample_bid = {
@@ -196,12 +226,12 @@ class EmailNotificationService:
             body_parts.extend(
                 [
                     '<div class="bid-card">',
-                    f'<div class="bid-title">{index}. {escape(str(bid.get("project_name") or "未命名项目"))}</div>',
+                    f'<div class="bid-title">{index}. {_esc(str(bid.get("project_name") or "未命名项目"))}</div>',
                 ]
                 + fields
             )
-            source_url = escape(str(bid.get("source_url") or "#"))
-            source_title = escape(str(bid.get("source_title") or "查看原文"))
+            source_url = _esc(str(bid.get("source_url") or "#"))
+            source_title = _esc(str(bid.get("source_title") or "查看原文"))
             body_parts.extend(
                 [
                     f'<a class="link-button" href="{source_url}" target="_blank" rel="noopener">{source_title}</a>',
@@ -220,21 +250,11 @@ class EmailNotificationService:
         return "\n".join(body_parts)
 
     def _format_bid_fields(self, bid: Mapping[str, object]) -> List[str]:
-        field_order = [
-            ("预算金额", bid.get("budget")),
-            ("采购人", bid.get("purchaser")),
-            ("获取文件时间", bid.get("doc_time")),
-            ("项目编号", bid.get("project_number")),
-            ("服务期限", bid.get("service_period")),
-            ("采购内容", bid.get("content")),
+        return [
+            f'<div class="bid-field"><span class="label">{label}：</span><span class="value">{_esc(str(value))}</span></div>'
+            for label, key in self._FIELD_LABELS
+            if (value := bid.get(key))
         ]
-        parts: List[str] = []
-        for label, value in field_order:
-            if value:
-                parts.append(
-                    f'<div class="bid-field"><span class="label">{label}：</span><span class="value">{escape(str(value))}</span></div>'
-                )
-        return parts
 
     @staticmethod
     def _resolve_path(value: str | Path, *, base: Path) -> Path:
@@ -1,9 +1,9 @@
+import logging
 import re
 from typing import Any, Dict, List, Mapping
 
 from core.parsers.base import BaseParser
 from core.bid_record import BidInfo
-from utils.logger import setup_logger
 from datetime import datetime, timezone
 import hashlib
 
@@ -12,23 +12,25 @@ class DaDanWangParser(BaseParser):
     Parser specifically for '大单网' articles.
     """
 
+    # Regex patterns for DaDanWang format
+    # Use a list of known labels to stop capturing
+    labels = ["项目名称", "预算金额", "单位名称", "采购目标", "采购要求", "预计采购时间", "云头条声明"]
+    _LABEL_PATTERN = "|".join(labels)
+
+    patterns = {
+        "project_name": re.compile(rf"项目名称[:：\s]*(.*?)(?={_LABEL_PATTERN}|$)"),
+        "budget": re.compile(rf"预算金额[:：\s]*(.*?)(?={_LABEL_PATTERN}|$)"),
+        "purchaser": re.compile(rf"单位名称[:：\s]*(.*?)(?={_LABEL_PATTERN}|$)"),
+        "doc_time": re.compile(rf"预计采购时间[:：\s]*(.*?)(?={_LABEL_PATTERN}|$)"),
+        "content": re.compile(rf"采购目标[:：\s]*(.*?)(?={_LABEL_PATTERN}|$)"),
+    }
+
+    # Keywords that indicate a winning bid (result) rather than a tender
+    winning_keywords = ["中标", "成交", "结果", "赢家", "第一名", "候选人"]
+    _winning_re = re.compile("|".join(map(re.escape, winning_keywords)))
+
     def __init__(self, logger=None) -> None:
-        self.logger = logger or setup_logger(self.__class__.__name__)
-        # Regex patterns for DaDanWang format
-        # Use a list of known labels to stop capturing
-        self.labels = ["项目名称", "预算金额", "单位名称", "采购目标", "采购要求", "预计采购时间", "云头条声明"]
-        label_pattern = "|".join(self.labels)
-        
-        self.patterns = {
-            "project_name": re.compile(rf"项目名称[:：\s]*(.*?)(?={label_pattern}|$)"),
-            "budget": re.compile(rf"预算金额[:：\s]*(.*?)(?={label_pattern}|$)"),
-            "purchaser": re.compile(rf"单位名称[:：\s]*(.*?)(?={label_pattern}|$)"),
-            "doc_time": re.compile(rf"预计采购时间[:：\s]*(.*?)(?={label_pattern}|$)"),
-            "content": re.compile(rf"采购目标[:：\s]*(.*?)(?={label_pattern}|$)"),
-        }
-        
-        # Keywords that indicate a winning bid (result) rather than a tender
-        self.winning_keywords = ["中标", "成交", "结果", "赢家", "第一名", "候选人"]
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
 
     def extract(self, text: str, article_meta: Mapping[str, Any]) -> List[Dict[str, str]]:
         if not text:
@@ -37,7 +39,7 @@ class DaDanWangParser(BaseParser):
         title = article_meta.get("title", "")
         
         # 1. Filter out winning bids based on title
-        if any(kw in title for kw in self.winning_keywords):
+        if self._winning_re.search(title):
             self.logger.info(f"Skipping article '{title}' as it appears to be a winning bid result.")
             return []
 
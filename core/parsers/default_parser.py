@@ -1,11 +1,11 @@
 import hashlib
+import logging
 import re
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from core.parsers.base import BaseParser
 from core.bid_record import BidInfo
-from utils.logger import setup_logger
 
 class DefaultParser(BaseParser):
     """
@@ -15,24 +15,34 @@ class DefaultParser(BaseParser):
 
     _LABELS: Tuple[str, ...] = ("项目名称", "预算金额", "采购人", "获取采购文件", "项目编号", "服务期限", "采购内容")
 
+    _PATTERNS: Optional[Dict[str, re.Pattern[str]]] = None
+    # Longest field value scanned for; bounds the lazy scan on blocks with no next label.
+    _MAX_VALUE_CHARS = 5000
+    project_split_pattern = re.compile(r"(?P<index>\d+)\s*项目名称")
+    required_fields: Tuple[str, ...] = ("project_name", "budget", "purchaser", "doc_time")
+
     def __init__(self, logger=None) -> None:
-        self.logger = logger or setup_logger(self.__class__.__name__)
-        pattern_config = {
-            "project_name": self._build_pattern("项目名称"),
-            "budget": self._build_pattern("预算金额"),
-            "purchaser": self._build_pattern("采购人"),
-            "doc_time": self._build_pattern("获取采购文件"),
-            "project_number": self._build_pattern("项目编号", r"[A-Za-z0-9\-]+"),
-            "service_period": self._build_pattern("服务期限"),
-            "content": self._build_pattern("采购内容"),
-        }
-        flags = re.IGNORECASE | re.DOTALL
-        self.patterns: Dict[str, re.Pattern[str]] = {
-            field: re.compile(pattern, flags)
-            for field, pattern in pattern_config.items()
-        }
-        self.project_split_pattern = re.compile(r"(?P<index>\d+)\s*项目名称")
-        self.required_fields = ("project_name", "budget", "purchaser", "doc_time")
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.patterns = self._compiled_patterns()
+
+    @classmethod
+    def _compiled_patterns(cls) -> Dict[str, re.Pattern[str]]:
+        """Compile field patterns once per class; they are shared by every instance."""
+        if cls._PATTERNS is None:
+            pattern_config = {
+                "project_name": cls._build_pattern("项目名称"),
+                "budget": cls._build_pattern("预算金额"),
+                "purchaser": cls._build_pattern("采购人"),
+                "doc_time": cls._build_pattern("获取采购文件"),
+                "project_number": cls._build_pattern("项目编号", r"[A-Za-z0-9\-]+"),
+                "service_period": cls._build_pattern("服务期限"),
+                "content": cls._build_pattern("采购内容"),
+            }
+            cls._PATTERNS = {
+                field: re.compile(pattern)
+                for field, pattern in pattern_config.items()
+            }
+        return cls._PATTERNS
 
     def extract(self, text: str, article_meta: Mapping[str, Any]) -> List[Dict[str, str]]:
         """
@@ -121,7 +131,16 @@ class DefaultParser(BaseParser):
         return datetime.now(timezone.utc).isoformat()
 
     @classmethod
-    def _build_pattern(cls, label: str, value_pattern: str = ".+?") -> str:
-        """Create a regex that captures text until the next label or end of block."""
+    def _build_pattern(cls, label: str, value_pattern: Optional[str] = None) -> str:
+        """
+        Create a regex that captures text until the next label or end of block.
+
+        Values may span lines, so the default is an any-character class capped at
+        ``_MAX_VALUE_CHARS``: a label followed by a long run without a boundary gives up
+        after that many steps instead of testing the lookahead at every character.
+        Labels are CJK, so no case folding is needed.
+        """
+        if value_pattern is None:
+            value_pattern = rf"[\s\S]{{1,{cls._MAX_VALUE_CHARS}}}?"
         boundaries = "|".join(l for l in cls._LABELS if l != label)
         return rf"{label}[:：\s]*({value_pattern})(?=\s*(?:{boundaries}|\Z))"
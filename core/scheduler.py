@@ -6,6 +6,7 @@ import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
 try:  # Python 3.9+
@@ -34,6 +35,7 @@ class CrawlScheduler:
         self._thread: Optional[threading.Thread] = None
         self._tzinfo = self._resolve_timezone(config.timezone)
         self._cron_expr = self._normalize_cron(config)
+        self._cron = self._build_cron(self._cron_expr)
 
     def start(self) -> None:
         if not self.config.enabled:
@@ -57,14 +59,18 @@ class CrawlScheduler:
         self._thread.join(timeout=1)
 
     def _run_forever(self) -> None:
-        while not self._stop_event.is_set():
-            wait_seconds = self._next_interval_seconds()
+        is_stopped = self._stop_event.is_set
+        wait = self._stop_event.wait
+        next_interval = self._next_interval_seconds
+        trigger = self._trigger_crawl
+        while not is_stopped():
+            wait_seconds = next_interval()
             if wait_seconds <= 0:
                 wait_seconds = 1
-            finished = self._stop_event.wait(wait_seconds)
+            finished = wait(wait_seconds)
             if finished:
                 break
-            self._trigger_crawl()
+            trigger()
 
     def _trigger_crawl(self) -> None:
         started = self.controller.start()
@@ -74,19 +80,21 @@ class CrawlScheduler:
             else:
                 self.logger.info("Scheduler skip: crawl already running.")
 
-    def _next_interval_seconds(self) -> float:
+    def _next_interval_seconds(self, now: Optional[datetime] = None) -> float:
         if self.config.interval_minutes and self.config.interval_minutes > 0:
             return float(self.config.interval_minutes) * 60.0
-        if self._cron_expr:
+        if self._cron_expr and self._cron is None:
+            return 3600
+        # Read the clock once and share it between the cron and daily fallback paths.
+        if now is None:
             now = datetime.now(self._tzinfo)
+        if self._cron_expr:
             try:
-                cron = SimpleCron(self._cron_expr)
-                next_time = cron.next_after(now)
+                next_time = self._cron.next_after(now)
                 return (next_time - now).total_seconds()
             except Exception:
                 return 3600
         # fallback daily at 07:00 local time
-        now = datetime.now(self._tzinfo)
         target = now.replace(hour=7, minute=0, second=0, microsecond=0)
         if target <= now:
             target += timedelta(days=1)
@@ -101,6 +109,17 @@ class CrawlScheduler:
                 pass
         return datetime.now().astimezone().tzinfo or timezone.utc
 
+    def _build_cron(self, expr: Optional[str]) -> Optional["SimpleCron"]:
+        """Parse the cron expression once; it is immutable for the scheduler's lifetime."""
+        if not expr:
+            return None
+        try:
+            return SimpleCron.get(expr)
+        except Exception as exc:
+            if self.logger:
+                self.logger.error("Invalid cron expression %r: %s", expr, exc)
+            return None
+
     def _normalize_cron(self, config: SchedulerConfig) -> Optional[str]:
         if config.cron:
             return config.cron.strip()
@@ -113,6 +132,13 @@ class CrawlScheduler:
         return None
 
 
+# Longest possible length of each month (index 1-12); February allows the leap day.
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+# How far next_after searches: eight leap-year cycles, so "0 0 29 2 *" always fires
+# within range even when combined with a weekday restriction.
+_SEARCH_YEARS = 32
+
+
 class SimpleCron:
     """Minimal cron parser supporting 5-field expressions (min hour dom mon dow)."""
 
@@ -125,59 +151,117 @@ class SimpleCron:
         self.days = self._parse_field(parts[2], 1, 31)
         self.months = self._parse_field(parts[3], 1, 12)
         self.weekdays = self._parse_field(parts[4], 0, 6, allow_sunday_seven=True)
+        if not self._days_reachable(self.days, self.months):
+            raise ValueError(f"Cron expression {expr!r} can never fire.")
+
+    @classmethod
+    def get(cls, expr: str) -> "SimpleCron":
+        """Return a shared, parsed instance for ``expr`` (instances are never mutated)."""
+        return _get_cron(expr.strip())
+
+    @staticmethod
+    def _days_reachable(days: Optional[int], months: Optional[int]) -> bool:
+        """Return False when no allowed day exists in any allowed month (e.g. Feb 30)."""
+        if days is None:
+            return True
+        for month in range(1, 13):
+            if months is not None and not (months >> month) & 1:
+                continue
+            if days & ((1 << (_DAYS_IN_MONTH[month] + 1)) - 1):
+                return True
+        return False
 
     def next_after(self, now: datetime) -> datetime:
+        """
+        Return the first matching minute strictly after ``now``.
+
+        Instead of testing every minute, a mismatching field advances the candidate
+        directly to the next allowed month/day/hour/minute, resetting the smaller
+        fields, so a daily expression needs only a handful of steps.
+        """
         candidate = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
-        for _ in range(525600):  # up to one year
-            if self._match(candidate):
-                return candidate
-            candidate += timedelta(minutes=1)
-        raise ValueError("Cron expression did not match within a year.")
-
-    def _match(self, dt: datetime) -> bool:
-        if self.minutes is not None and dt.minute not in self.minutes:
-            return False
-        if self.hours is not None and dt.hour not in self.hours:
-            return False
-        if self.days is not None and dt.day not in self.days:
-            return False
-        if self.months is not None and dt.month not in self.months:
+        deadline = candidate.replace(
+            year=candidate.year + _SEARCH_YEARS, month=1, day=1, hour=0, minute=0
+        )
+        minutes, hours, months = self.minutes, self.hours, self.months
+        day_matches = self._day_matches
+        next_bit = self._next_bit
+        while candidate < deadline:
+            if months is not None and not (months >> candidate.month) & 1:
+                month = next_bit(months, candidate.month)
+                year = candidate.year
+                if month is None:
+                    month = next_bit(months, 0)
+                    year += 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if hours is not None and not (hours >> candidate.hour) & 1:
+                hour = next_bit(hours, candidate.hour)
+                if hour is None:
+                    candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                else:
+                    candidate = candidate.replace(hour=hour, minute=0)
+                continue
+            if minutes is not None and not (minutes >> candidate.minute) & 1:
+                minute = next_bit(minutes, candidate.minute)
+                if minute is None:
+                    candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                else:
+                    candidate = candidate.replace(minute=minute)
+                continue
+            return candidate
+        raise ValueError(f"Cron expression did not match within {_SEARCH_YEARS} years.")
+
+    def _day_matches(self, dt: datetime) -> bool:
+        if self.days is not None and not (self.days >> dt.day) & 1:
             return False
-        weekday = dt.weekday()
-        if self.weekdays is not None and weekday not in self.weekdays:
+        if self.weekdays is not None and not (self.weekdays >> dt.weekday()) & 1:
             return False
         return True
 
+    @staticmethod
+    def _next_bit(mask: int, current: int) -> Optional[int]:
+        """Return the smallest allowed value greater than or equal to ``current``."""
+        remaining = mask >> current
+        if not remaining:
+            return None
+        return current + (remaining & -remaining).bit_length() - 1
+
+    @staticmethod
+    @lru_cache(maxsize=256)
     def _parse_field(
-        self,
         field: str,
         min_value: int,
         max_value: int,
         *,
         allow_sunday_seven: bool = False,
-    ) -> Optional[set[int]]:
+    ) -> Optional[int]:
+        """Return a bitmask with bit ``n`` set for every allowed value, or None for ``*``."""
         field = field.strip()
         if not field or field == "*":
             return None
-        values: set[int] = set()
+        mask = 0
         for part in field.split(","):
             part = part.strip()
             if not part:
                 continue
-            values.update(
-                self._expand_part(part, min_value, max_value, allow_sunday_seven)
-            )
-        if not values:
+            for value in SimpleCron._expand_part(part, min_value, max_value, allow_sunday_seven):
+                mask |= 1 << value
+        if not mask:
             return None
-        return values
+        return mask
 
+    @staticmethod
+    @lru_cache(maxsize=256)
     def _expand_part(
-        self,
         part: str,
         min_value: int,
         max_value: int,
         allow_sunday_seven: bool,
-    ) -> set[int]:
+    ) -> frozenset[int]:
         step = 1
         if "/" in part:
             base, step_str = part.split("/", 1)
@@ -201,4 +285,9 @@ class SimpleCron:
         if allow_sunday_seven and 7 in values:
             values.add(0)
             values.discard(7)
-        return values
+        return frozenset(values)
+
+
+@lru_cache(maxsize=128)
+def _get_cron(expr: str) -> SimpleCron:
+    return SimpleCron(expr)
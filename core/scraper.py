@@ -1,10 +1,13 @@
 from __future__ import annotations
+import queue
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Iterable, List, Mapping, Optional
+from typing import Callable, Iterable, Iterator, List, Mapping, Optional
 
-from bs4 import BeautifulSoup
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -14,11 +17,69 @@ from selenium.webdriver.support.ui import WebDriverWait
 from utils.config_loader import load_config
 from utils.logger import setup_logger
 
+try:  # lxml is a C parser and considerably faster than the pure-Python html.parser
+    import lxml  # noqa: F401
+
+    _HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - fall back to the stdlib parser
+    _HTML_PARSER = "html.parser"
+
 ProgressCallback = Callable[[int, int, Optional[Mapping]], None]
 
+# Only the tags parse_html looks at (plus their subtrees) are built into the soup;
+# head <script>/<style> blocks, which are large on WeChat pages, are skipped.
+_ARTICLE_STRAINER = SoupStrainer(["h1", "a", "span", "em", "div", "meta", "img", "p", "section"])
+_TITLE_ATTRS = {"class": "rich_media_title"}
+_AUTHOR_LINK_ATTRS = {"class": "rich_media_meta_link"}
+_AUTHOR_TEXT_ATTRS = {"class": "rich_media_meta_text"}
+_PUBLISH_TIME_ATTRS = {"id": "publish_time"}
+_CONTENT_ID_ATTRS = {"id": "js_content"}
+_CONTENT_CLASS_ATTRS = {"class": "rich_media_content"}
+_DESCRIPTION_ATTRS = {"name": "description"}
+_CONTENT_CHILD_TAGS = ["p", "section", "img"]
+
+# Scroll one viewport at a time until the (possibly growing) page end is reached,
+# then return to the top. Runs via execute_async_script; the last argument is the
+# WebDriver completion callback.
+_SCROLL_SCRIPT = """
+var delay = arguments[0];
+var maxSteps = arguments[1];
+var done = arguments[arguments.length - 1];
+var step = window.innerHeight || 800;
+var position = 0;
+var steps = 0;
+function tick() {
+    if (position >= document.body.scrollHeight || steps >= maxSteps) {
+        window.scrollTo(0, 0);
+        done(steps);
+        return;
+    }
+    window.scrollTo(0, position);
+    position += step;
+    steps += 1;
+    setTimeout(tick, delay);
+}
+tick();
+"""
+
 
 class WeChatArticleScraper:
-    """Selenium-based WeChat article scraper with retries and batch support."""
+    """
+    WeChat article scraper with retries and batch support.
+
+    Articles are first requested as plain HTML over a pooled HTTP session; the
+    Selenium browser is only started for pages whose content is not present in
+    the static response.
+    """
+
+    USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+
+    # Keep SCROLL_STEP_DELAY_MS * SCROLL_MAX_STEPS below WebDriver's 30s script timeout.
+    SCROLL_STEP_DELAY_MS = 300
+    SCROLL_MAX_STEPS = 80
 
     def __init__(
         self,
@@ -26,6 +87,7 @@ class WeChatArticleScraper:
         *,
         config: Optional[Mapping] = None,
         driver_factory: Optional[Callable[[], webdriver.Chrome]] = None,
+        session: Optional[requests.Session] = None,
         logger=None,
     ) -> None:
         self.config_path = Path(config_path)
@@ -38,8 +100,14 @@ class WeChatArticleScraper:
         self.retry_count = scraper_cfg.get("retry_count", 3)
         self.retry_delay = scraper_cfg.get("retry_delay", 5)
         self.random_delay_range = tuple(scraper_cfg.get("random_delay_range", (2, 5)))
+        self.static_fetch = bool(scraper_cfg.get("static_fetch", True))
+        self.request_timeout = scraper_cfg.get("request_timeout", 10)
+        self.max_workers = max(1, int(scraper_cfg.get("max_workers", 1) or 1))
 
         self.driver_factory = driver_factory
+        # Only a session created here is closed by close(); an injected one belongs to the caller.
+        self._owns_session = session is None
+        self.session = session or requests.Session()
         log_dir = paths_cfg.get("log_dir", "data/logs")
         self.logger = logger or setup_logger(self.__class__.__name__, log_dir=log_dir)
         self.driver: Optional[webdriver.Chrome] = None
@@ -70,10 +138,7 @@ class WeChatArticleScraper:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
-        chrome_options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+        chrome_options.add_argument(f"user-agent={self.USER_AGENT}")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
@@ -106,8 +171,14 @@ class WeChatArticleScraper:
                 self.logger.error("Error closing browser: %s", exc)
             finally:
                 self.driver = None
+        if self._owns_session:
+            self.session.close()
 
     def scrape_article(self, url: str) -> Optional[dict]:
+        if self.static_fetch:
+            article_data = self._fetch_static(url)
+            if article_data:
+                return article_data
         driver = self.init_driver()
         try:
             self.logger.debug("Navigating to %s", url)
@@ -130,22 +201,27 @@ class WeChatArticleScraper:
         if not urls:
             return []
 
-        self.init_driver()
         results: List[dict] = []
         total = len(urls)
         failures = 0
-        self.logger.info("Starting batch crawl: %d article(s).", total)
-
-        for index, url in enumerate(urls, start=1):
-            self.logger.info("Processing %d/%d: %s", index, total, url)
-            article_data = self._scrape_with_retry(url)
+        workers = min(self.max_workers, total)
+        self.logger.info("Starting batch crawl: %d article(s), %d worker(s).", total, workers)
+
+        if workers > 1:
+            outcomes = self._scrape_parallel(urls, workers)
+        else:
+            if not self.static_fetch:
+                self.init_driver()
+            outcomes = map(self._process_url, range(1, total + 1), [total] * total, urls)
+
+        # Callbacks always run on the calling thread, in submission order.
+        for index, article_data in enumerate(outcomes, start=1):
             if article_data:
                 results.append(article_data)
                 if callback:
                     callback(index, total, article_data)
             else:
                 failures += 1
-            self._random_delay()
 
         success_rate = (len(results) / total * 100) if total else 0
         self.logger.info(
@@ -156,6 +232,65 @@ class WeChatArticleScraper:
         )
         return results
 
+    def _process_url(self, index: int, total: int, url: str) -> Optional[dict]:
+        self.logger.info("Processing %d/%d: %s", index, total, url)
+        article_data = self._scrape_with_retry(url)
+        self._random_delay()
+        return article_data
+
+    def _scrape_parallel(self, urls: List[str], workers: int) -> Iterator[Optional[dict]]:
+        """
+        Scrape ``urls`` with ``workers`` threads, yielding results in input order.
+
+        WebDriver instances are not thread-safe, so every worker thread checks out
+        its own scraper (and therefore its own browser and HTTP session) from a
+        pool; the per-scraper random delay keeps each worker polite.
+        """
+        scrapers = [self._spawn_worker() for _ in range(workers)]
+        pool: "queue.Queue[WeChatArticleScraper]" = queue.Queue()
+        for scraper in scrapers:
+            pool.put(scraper)
+        total = len(urls)
+
+        def run(index: int, url: str) -> Optional[dict]:
+            scraper = pool.get()
+            try:
+                return scraper._process_url(index, total, url)
+            finally:
+                pool.put(scraper)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                yield from executor.map(run, range(1, total + 1), urls)
+        finally:
+            for scraper in scrapers:
+                scraper.close()
+
+    def _spawn_worker(self) -> "WeChatArticleScraper":
+        return WeChatArticleScraper(
+            config=self.config,
+            driver_factory=self.driver_factory,
+            logger=self.logger,
+        )
+
+    def _fetch_static(self, url: str) -> Optional[dict]:
+        """Fetch the article without a browser; None when the page needs rendering."""
+        try:
+            response = self.session.get(
+                url, headers={"User-Agent": self.USER_AGENT}, timeout=self.request_timeout
+            )
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            self.logger.debug("Static fetch failed for %s: %s", url, exc)
+            return None
+
+        article_data = self.parse_html(response.text)
+        if not article_data.get("content_text"):
+            self.logger.debug("No static content for %s; falling back to browser.", url)
+            return None
+        article_data["url"] = url
+        return article_data
+
     def _scrape_with_retry(self, url: str) -> Optional[dict]:
         for attempt in range(1, self.retry_count + 1):
             article = self.scrape_article(url)
@@ -189,53 +324,53 @@ class WeChatArticleScraper:
         if not self.driver:
             return
         try:
-            total_height = self.driver.execute_script("return document.body.scrollHeight")
-            viewport_height = self.driver.execute_script("return window.innerHeight")
-            current_position = 0
-            while current_position < total_height:
-                self.driver.execute_script(f"window.scrollTo(0, {current_position});")
-                time.sleep(0.3)
-                current_position += viewport_height
-                total_height = self.driver.execute_script("return document.body.scrollHeight")
-            self.driver.execute_script("window.scrollTo(0, 0);")
+            # The whole scroll loop runs inside the browser so each article costs a
+            # single WebDriver round trip instead of two per viewport.
+            self.driver.execute_async_script(
+                _SCROLL_SCRIPT, self.SCROLL_STEP_DELAY_MS, self.SCROLL_MAX_STEPS
+            )
             time.sleep(0.5)
         except Exception as exc:
             self.logger.warning("Scroll failed: %s", exc)
 
     @staticmethod
     def parse_html(html: str) -> dict:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_ARTICLE_STRAINER)
         article_data: dict = {}
-        title_tag = soup.find("h1", class_="rich_media_title")
+        title_tag = soup.find("h1", attrs=_TITLE_ATTRS)
         if title_tag:
             article_data["title"] = title_tag.get_text().strip()
 
-        author_tag = soup.find("a", class_="rich_media_meta_link")
+        author_tag = soup.find("a", attrs=_AUTHOR_LINK_ATTRS)
         if not author_tag:
-            author_tag = soup.find("span", class_="rich_media_meta_text")
+            author_tag = soup.find("span", attrs=_AUTHOR_TEXT_ATTRS)
         if author_tag:
             article_data["author"] = author_tag.get_text().strip()
 
-        time_tag = soup.find("em", id="publish_time")
+        time_tag = soup.find("em", attrs=_PUBLISH_TIME_ATTRS)
         if time_tag:
             article_data["publish_time"] = time_tag.get_text().strip()
 
-        content_tag = soup.find("div", id="js_content") or soup.find("div", class_="rich_media_content")
+        content_tag = soup.find("div", attrs=_CONTENT_ID_ATTRS) or soup.find(
+            "div", attrs=_CONTENT_CLASS_ATTRS
+        )
         if content_tag:
             article_data["content_text"] = content_tag.get_text().strip()
             article_data["content_html"] = str(content_tag)
-            paragraphs = content_tag.find_all(["p", "section"])
-            article_data["paragraphs"] = [
-                p.get_text().strip() for p in paragraphs if p.get_text().strip()
-            ]
-            images = content_tag.find_all("img")
-            article_data["images"] = []
-            for img in images:
-                img_url = img.get("data-src") or img.get("src")
-                if img_url:
-                    article_data["images"].append(img_url)
-
-        desc_tag = soup.find("meta", attrs={"name": "description"})
+            # Collect paragraphs and images in a single walk over the content subtree.
+            paragraphs: List[str] = []
+            images: List[str] = []
+            for tag in content_tag.find_all(_CONTENT_CHILD_TAGS):
+                if tag.name == "img":
+                    img_url = tag.get("data-src") or tag.get("src")
+                    if img_url:
+                        images.append(img_url)
+                elif text := tag.get_text().strip():
+                    paragraphs.append(text)
+            article_data["paragraphs"] = paragraphs
+            article_data["images"] = images
+
+        desc_tag = soup.find("meta", attrs=_DESCRIPTION_ATTRS)
         if desc_tag:
             article_data["description"] = desc_tag.get("content", "")
 
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 from sqlalchemy import Boolean, Column, Integer, String, Text
 
-from core.database import Base
+from core.database import Base, BulkInsertMixin, DictFieldsMixin
 
 
-class ArticleRecord(Base):
+class ArticleRecord(BulkInsertMixin, DictFieldsMixin, Base):
     """Persisted article metadata for deduplication and stats."""
 
     __tablename__ = "articles"
+    _dict_fields = ("url", "crawled_time")
+    _dict_text_fields = ("title", "author", "publish_time", "digest")
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     url = Column(String(512), unique=True, nullable=False, index=True)
@@ -23,16 +25,10 @@ class ArticleRecord(Base):
     bid_count = Column(Integer, default=0)
 
     def to_dict(self) -> dict:
-        return {
-            "url": self.url,
-            "title": self.title or "",
-            "author": self.author or "",
-            "publish_time": self.publish_time or "",
-            "digest": self.digest or "",
-            "crawled_time": self.crawled_time,
-            "has_bid_info": bool(self.has_bid_info),
-            "bid_count": self.bid_count or 0,
-        }
+        data = super().to_dict()
+        data["has_bid_info"] = bool(self.has_bid_info)
+        data["bid_count"] = self.bid_count or 0
+        return data
 
     @classmethod
     def from_mapping(cls, payload: dict) -> "ArticleRecord":
@@ -4,13 +4,30 @@ from __future__ import annotations
 
 from sqlalchemy import Column, Integer, String, Text
 
-from core.database import Base
+from core.database import Base, BulkInsertMixin, DictFieldsMixin
 
 
-class BidRecord(Base):
+class BidRecord(BulkInsertMixin, DictFieldsMixin, Base):
     """Persisted bid entries."""
 
     __tablename__ = "bids"
+    _dict_fields = (
+        "id",
+        "project_name",
+        "budget",
+        "purchaser",
+        "doc_time",
+        "extracted_time",
+        "status",
+    )
+    _dict_text_fields = (
+        "project_number",
+        "service_period",
+        "content",
+        "source_url",
+        "source_title",
+        "updated_time",
+    )
 
     id = Column(String(64), primary_key=True)
     project_name = Column(Text, nullable=False)
@@ -22,27 +39,11 @@ class BidRecord(Base):
     content = Column(Text, nullable=True)
     source_url = Column(Text, nullable=True)
     source_title = Column(Text, nullable=True)
-    extracted_time = Column(String(64), nullable=False)
+    # ISO-8601 UTC strings sort chronologically, so the listing order uses this index.
+    extracted_time = Column(String(64), nullable=False, index=True)
     status = Column(String(32), nullable=False, default="new", index=True)
     updated_time = Column(String(64), nullable=True)
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "project_name": self.project_name,
-            "budget": self.budget,
-            "purchaser": self.purchaser,
-            "doc_time": self.doc_time,
-            "project_number": self.project_number or "",
-            "service_period": self.service_period or "",
-            "content": self.content or "",
-            "source_url": self.source_url or "",
-            "source_title": self.source_title or "",
-            "extracted_time": self.extracted_time,
-            "status": self.status,
-            "updated_time": self.updated_time or "",
-        }
-
     @classmethod
     def from_mapping(cls, payload: dict) -> "BidRecord":
         return cls(
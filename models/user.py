@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, String, func
 from werkzeug.security import generate_password_hash, check_password_hash
 
-from core.database import Base
+from core.database import Base, utcnow
 
 
 class User(Base):
@@ -19,13 +18,20 @@ class User(Base):
     id = Column(String(36), primary_key=True)  # UUID or username
     username = Column(String(50), unique=True, nullable=False)
     password_hash = Column(String(256), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Timestamp defaults: see core.database.utcnow.
+    created_at = Column(DateTime, default=utcnow, server_default=func.now())
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow)
     
     def set_password(self, password: str) -> None:
         self.password_hash = generate_password_hash(password, method='pbkdf2:sha256')
         
     def check_password(self, password: str) -> bool:
+        """
+        Verify a password against the stored PBKDF2 hash.
+
+        Deliberately slow; only call it at login or password change. Authenticated
+        requests are recognised through the signed Flask session set by AuthManager.
+        """
         return check_password_hash(self.password_hash, password)
     
     @classmethod
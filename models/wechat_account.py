@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Dict, List, Optional
+import json
+from typing import Dict, Iterable, List, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    String,
+    Text,
+    bindparam,
+    event,
+    func,
+    inspect,
+    select,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, reconstructor, validates
 
-from core.database import Base
+from core.database import Base, BulkInsertMixin, DictFieldsMixin, utcnow
 
 
-class WeChatAccount(Base):
+class WeChatAccount(BulkInsertMixin, DictFieldsMixin, Base):
     """WeChat public account model."""
     
     __tablename__ = "wechat_accounts"
+    _dict_fields = ("id", "name", "fakeid", "token", "cookie", "page_size", "article_limit")
     
     id = Column(String(100), primary_key=True)
     name = Column(String(200), nullable=False)
@@ -28,45 +42,61 @@ class WeChatAccount(Base):
     filter_keyword_logic = Column(String(10), default="OR")  # OR / AND
     
     enabled = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
+    # Timestamp defaults: see core.database.utcnow.
+    created_at = Column(DateTime, default=utcnow, server_default=func.now())
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow)
+
+    # Per-instance decoded filter_keywords; the class attribute only supplies the
+    # initial None for instances built without the reconstructor or validator running.
+    __allow_unmapped__ = True
+    _keywords_cache: Optional[List[str]] = None
+
+    @reconstructor
+    def _init_on_load(self) -> None:
+        self._keywords_cache = None
+
+    @validates("filter_keywords")
+    def _reset_keywords_cache(self, key: str, value: Optional[str]) -> Optional[str]:
+        # Any write to the JSON column invalidates the decoded list.
+        self._keywords_cache = None
+        return value
+
+    def _decoded_keywords(self) -> List[str]:
+        """Return filter_keywords decoded from JSON, parsed once per loaded instance."""
+        if self._keywords_cache is None:
+            keywords = []
+            if self.filter_keywords:
+                try:
+                    keywords = json.loads(self.filter_keywords)
+                except ValueError:
+                    keywords = []
+            if not isinstance(keywords, list):
+                keywords = []  # e.g. "null" or a bare JSON string
+            self._keywords_cache = keywords
+        return self._keywords_cache
+
     def to_dict(self) -> Dict:
         """Convert model to dictionary."""
-        import json
-        keywords = []
-        if self.filter_keywords:
-            try:
-                keywords = json.loads(self.filter_keywords)
-            except:
-                keywords = []
-
-        return {
-            "id": self.id,
-            "name": self.name,
-            "fakeid": self.fakeid,
-            "token": self.token,
-            "cookie": self.cookie,
-            "page_size": self.page_size,
-            "article_limit": self.article_limit,
-            "filter_keywords": keywords,
-            "filter_keyword_logic": self.filter_keyword_logic or "OR",
-            "enabled": self.enabled,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        data = super().to_dict()
+        data["filter_keywords"] = list(self._decoded_keywords())
+        data["filter_keyword_logic"] = self.filter_keyword_logic or "OR"
+        data["enabled"] = self.enabled
+        created_at, updated_at = self.created_at, self.updated_at
+        data["created_at"] = created_at.isoformat() if created_at else None
+        data["updated_at"] = updated_at.isoformat() if updated_at else None
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'WeChatAccount':
         """Create model from dictionary."""
-        import json
         keywords = data.get("filter_keywords", [])
         if isinstance(keywords, list):
             keywords_json = json.dumps(keywords, ensure_ascii=False)
         else:
+            keywords = []
             keywords_json = "[]"
 
-        return cls(
+        account = cls(
             id=data.get("id"),
             name=data["name"],
             fakeid=data.get("fakeid", ""),
@@ -78,33 +108,71 @@ class WeChatAccount(Base):
             filter_keyword_logic=data.get("filter_keyword_logic", "OR"),
             enabled=data.get("enabled", True)
         )
+        account._keywords_cache = list(keywords)
+        return account
     
+    @classmethod
+    def _record_from_payload(cls, payload: Dict) -> 'WeChatAccount':
+        return cls.from_dict(payload)
+
+    @classmethod
+    def bulk_upsert(cls, session: Session, items: Iterable[Dict], *, commit: bool = True) -> int:
+        """
+        Insert or update many accounts keyed by id in a single statement.
+
+        PostgreSQL and SQLite use INSERT ... ON CONFLICT DO UPDATE; other backends
+        fall back to per-row merges within the same transaction.
+        """
+        mappings = [cls._column_values(cls._record_from_payload(item)) for item in items]
+        if not mappings:
+            return 0
+
+        dialect_insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+        if dialect_insert is None:
+            for mapping in mappings:
+                session.merge(cls(**mapping))
+        else:
+            stmt = dialect_insert(cls)
+            updates = {column: stmt.excluded[column] for column in _UPSERT_COLUMNS}
+            updates["updated_at"] = utcnow()
+            stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=updates)
+            session.execute(stmt, mappings)
+            # Core upserts bypass the identity map; reload any account already held.
+            ids = {mapping["id"] for mapping in mappings}
+            for account in list(session.identity_map.values()):
+                if isinstance(account, cls) and inspect(account).identity[0] in ids:
+                    session.expire(account)
+        if commit:
+            session.commit()
+        return len(mappings)
+
     @classmethod
     def get_all(cls, session: Session, enabled_only: bool = False) -> List['WeChatAccount']:
         """Get all accounts."""
-        query = session.query(cls)
-        if enabled_only:
-            query = query.filter(cls.enabled == True)
-        return query.all()
+        stmt = _SELECT_ENABLED if enabled_only else _SELECT_ALL
+        return list(session.execute(stmt).scalars())
     
     @classmethod
     def get_by_id(cls, session: Session, account_id: str) -> Optional['WeChatAccount']:
         """Get account by ID."""
-        return session.query(cls).filter(cls.id == account_id).first()
+        return session.execute(_SELECT_BY_ID, {"account_id": account_id}).scalar_one_or_none()
     
     @classmethod
-    def create(cls, session: Session, data: Dict) -> 'WeChatAccount':
-        """Create new account."""
+    def create(cls, session: Session, data: Dict, *, commit: bool = True) -> 'WeChatAccount':
+        """Create new account; with ``commit=False`` the caller owns the transaction."""
         account = cls.from_dict(data)
         session.add(account)
-        session.commit()
-        session.refresh(account)
+        if commit:
+            session.commit()
+        else:
+            session.flush()
         return account
     
     @classmethod
-    def update(cls, session: Session, account_id: str, data: Dict) -> Optional['WeChatAccount']:
-        """Update existing account."""
-        import json
+    def update(
+        cls, session: Session, account_id: str, data: Dict, *, commit: bool = True
+    ) -> Optional['WeChatAccount']:
+        """Update existing account; with ``commit=False`` the caller owns the transaction."""
         account = cls.get_by_id(session, account_id)
         if not account:
             return None
@@ -112,21 +180,49 @@ class WeChatAccount(Base):
         for key, value in data.items():
             if key == 'filter_keywords' and isinstance(value, list):
                 setattr(account, key, json.dumps(value, ensure_ascii=False))
+                account._keywords_cache = list(value)
             elif hasattr(account, key) and key not in ['id', 'created_at']:
                 setattr(account, key, value)
-        
-        account.updated_at = datetime.utcnow()
-        session.commit()
-        session.refresh(account)
+        # updated_at is bumped by the column's onupdate when the UPDATE is flushed.
+        if commit:
+            session.commit()
         return account
     
     @classmethod
-    def delete(cls, session: Session, account_id: str) -> bool:
-        """Delete account by ID."""
+    def delete(cls, session: Session, account_id: str, *, commit: bool = True) -> bool:
+        """Delete account by ID; with ``commit=False`` the caller owns the transaction."""
         account = cls.get_by_id(session, account_id)
         if not account:
             return False
         
         session.delete(account)
-        session.commit()
+        if commit:
+            session.commit()
         return True
+
+
+@event.listens_for(WeChatAccount, "expire")
+def _reset_keywords_cache_on_expire(target: WeChatAccount, attrs) -> None:
+    # Expired columns (after commit/expire, e.g. following bulk_upsert) will be
+    # reloaded and may carry different keywords than the cached decode.
+    if target is not None:  # None when the instance was already garbage collected
+        target._keywords_cache = None
+
+
+_UPSERT_COLUMNS = (
+    "name",
+    "fakeid",
+    "token",
+    "cookie",
+    "page_size",
+    "article_limit",
+    "filter_keywords",
+    "filter_keyword_logic",
+    "enabled",
+)
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Built once so every lookup hits SQLAlchemy's compiled statement cache directly.
+_SELECT_ALL = select(WeChatAccount)
+_SELECT_ENABLED = _SELECT_ALL.where(WeChatAccount.enabled == True)  # noqa: E712
+_SELECT_BY_ID = select(WeChatAccount).where(WeChatAccount.id == bindparam("account_id"))
@@ -1,17 +1,103 @@
+import hashlib
 import json
+import os
 import shutil
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from utils.logger import setup_logger
 
+try:  # orjson encodes straight to UTF-8 bytes and is several times faster than json
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None
+
+try:  # ijson parses incrementally, so filtered reads never hold the whole list
+    import ijson
+except ImportError:  # pragma: no cover - fall back to a full load + filter
+    ijson = None
+
+
+# fdatasync skips the metadata flush when only file contents changed; macOS and
+# Windows lack it, so fall back to a full fsync there.
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _umask_file_mode() -> int:
+    # The umask can only be read by setting it, so do that once at import.
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# mkstemp creates files as 0600; saved files get the mode open() would have given them.
+_FILE_MODE = _umask_file_mode()
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _copy_items(items: List[Any]) -> List[Any]:
+    # Callers append to the list and edit bids in place; hand out copies so the
+    # cached parse stays pristine.
+    return [dict(item) if isinstance(item, dict) else item for item in items]
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: Any, *, pretty: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        try:
+            return orjson.dumps(data, option=option)
+        except orjson.JSONEncodeError:
+            # Only non-str dict keys need the slower OPT_NON_STR_KEYS mode.
+            return orjson.dumps(data, option=option | orjson.OPT_NON_STR_KEYS)
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 class FileStorage:
     """Utility for resilient JSON persistence with backup support."""
 
-    def __init__(self, *, logger=None) -> None:
+    SYNC_MODES = ("none", "datasync", "fsync", "dirfsync")
+    # Below this size a full cached parse beats incremental ijson parsing.
+    STREAM_MIN_BYTES = 8 * 1024 * 1024
+
+    def __init__(
+        self, *, logger=None, sync_mode: str = "datasync", pretty: bool = False
+    ) -> None:
+        """
+        ``sync_mode`` controls how a save is flushed before the rename:
+        ``none`` (fastest, relies on backups), ``datasync`` (file data only),
+        ``fsync`` (data and metadata) or ``dirfsync`` (also syncs the directory
+        entry so the rename itself survives a crash).
+
+        Files are written as compact JSON; ``pretty=True`` indents them for
+        inspection by hand.
+        """
+        if sync_mode not in self.SYNC_MODES:
+            raise ValueError(f"Unknown sync_mode {sync_mode!r}; expected one of {self.SYNC_MODES}.")
         self.logger = logger or setup_logger(self.__class__.__name__)
+        self.sync_mode = sync_mode
+        self.pretty = pretty
+        # path -> ((mtime_ns, size), parsed list); a stat() replaces read + parse
+        # while the file is unchanged.
+        self._read_cache: Dict[Path, Tuple[Tuple[int, int], List[dict]]] = {}
+        # path -> (payload digest, (mtime_ns, size)) of this instance's last write
+        self._last_written: Dict[Path, Tuple[bytes, Optional[Tuple[int, int]]]] = {}
 
     def load_json(self, file_path: Path, default: Optional[List[dict]] = None) -> List[dict]:
         """
@@ -20,16 +106,22 @@ class FileStorage:
         Returns default (or empty list) when file is missing or invalid.
         """
         path = Path(file_path)
-        if not path.exists():
+        key = _stat_key(path)
+        if key is None:
             return list(default or [])
+        cached = self._read_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return _copy_items(cached[1])
 
         try:
-            with path.open("r", encoding="utf-8") as fp:
-                data = json.load(fp)
+            data = _loads(path.read_bytes())
             if isinstance(data, list):
-                return data
+                self._read_cache[path] = (key, data)
+                return _copy_items(data)
             self.logger.warning("JSON file %s does not contain a list; returning default.", path)
-        except json.JSONDecodeError as exc:
+        except FileNotFoundError:
+            pass
+        except ValueError as exc:  # json/orjson decode errors, including bad UTF-8
             self.logger.error("JSON parse error for %s: %s", path, exc)
             self._quarantine_corrupt_file(path)
         except OSError as exc:
@@ -37,6 +129,55 @@ class FileStorage:
 
         return list(default or [])
 
+    def cache_key(self, file_path: Path) -> Optional[Tuple[int, int]]:
+        """
+        Return the ``(mtime_ns, size)`` key the read cache uses for ``file_path``.
+
+        None when the file is missing. Callers can key their own derived indexes on it.
+        """
+        return _stat_key(Path(file_path))
+
+    def load_json_stream(
+        self, file_path: Path, predicate: Optional[Callable[[dict], bool]] = None
+    ) -> Iterator[dict]:
+        """
+        Yield the items of a JSON list file, keeping only those matching ``predicate``.
+
+        Files that are already in the read cache, or smaller than
+        ``STREAM_MIN_BYTES``, are filtered from ``load_json``'s cached parse. Larger
+        uncached files are parsed one item at a time with ijson (when installed), so
+        memory stays proportional to the matches rather than the file.
+        """
+        if ijson is None or predicate is None:
+            items = self.load_json(file_path)
+            yield from (items if predicate is None else filter(predicate, items))
+            return
+
+        path = Path(file_path)
+        key = _stat_key(path)
+        if key is None:
+            return
+        cached = self._read_cache.get(path)
+        if cached is not None and cached[0] == key:
+            yield from _copy_items([item for item in cached[1] if predicate(item)])
+            return
+        if key[1] < self.STREAM_MIN_BYTES:
+            yield from filter(predicate, self.load_json(path))
+            return
+
+        try:
+            with path.open("rb") as fp:
+                for item in ijson.items(fp, "item", use_float=True):
+                    if predicate(item):
+                        yield item
+        except FileNotFoundError:
+            return
+        except ijson.JSONError as exc:
+            self.logger.error("JSON parse error for %s: %s", path, exc)
+            self._quarantine_corrupt_file(path)
+        except OSError as exc:
+            self.logger.error("Unable to read %s: %s", path, exc)
+
     def save_json(self, file_path: Path, data: Iterable[dict]) -> bool:
         """
         Persist JSON data to disk with backup + rollback semantics.
@@ -44,26 +185,71 @@ class FileStorage:
         Returns True on success.
         """
         path = Path(file_path)
+        payload = data if isinstance(data, list) else list(data)
+        encoded = _dumps(payload, pretty=self.pretty)
+        digest = hashlib.blake2b(encoded, digest_size=16).digest()
+        # Skip the backup + write when we already wrote these exact bytes and nobody
+        # has touched the file since.
+        if self._last_written.get(path) == (digest, _stat_key(path)):
+            return True
+
         path.parent.mkdir(parents=True, exist_ok=True)
 
         backup_path = None
         if path.exists():
             backup_path = self.backup_file(path)
 
-        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path: Optional[Path] = None
         try:
-            with tmp_path.open("w", encoding="utf-8") as fp:
-                json.dump(list(data), fp, ensure_ascii=False, indent=2)
-            tmp_path.replace(path)
+            # A unique sibling temp file keeps concurrent writers from clobbering
+            # each other's half-written output before the atomic replace.
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=f"{path.name}.", suffix=".tmp", dir=path.parent
+            )
+            tmp_path = Path(tmp_name)
+            self._write_file(fd, encoded)
+            os.replace(tmp_path, path)
+            if self.sync_mode == "dirfsync":
+                self._sync_directory(path.parent)
+            self._last_written[path] = (digest, _stat_key(path))
             return True
         except OSError as exc:
+            self._last_written.pop(path, None)
             self.logger.error("Failed to save %s: %s", path, exc)
-            if tmp_path.exists():
+            if tmp_path is not None:
                 tmp_path.unlink(missing_ok=True)
             if backup_path:
                 self._restore_backup(backup_path, path)
             return False
 
+    def _write_file(self, fd: int, payload: bytes) -> None:
+        """Write ``payload`` to ``fd`` unbuffered, sync it and close the descriptor."""
+        try:
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, _FILE_MODE)
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            if self.sync_mode == "datasync":
+                _fdatasync(fd)
+            elif self.sync_mode != "none":
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _sync_directory(self, directory: Path) -> None:
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError as exc:  # e.g. Windows cannot open directories
+            self.logger.debug("Cannot open %s for fsync: %s", directory, exc)
+            return
+        try:
+            os.fsync(fd)
+        except OSError as exc:
+            self.logger.debug("Directory fsync failed for %s: %s", directory, exc)
+        finally:
+            os.close(fd)
+
     def backup_file(self, file_path: Path) -> Optional[Path]:
         """Create a timestamped backup and trim history to the latest 3 copies."""
         path = Path(file_path)
@@ -72,14 +258,31 @@ class FileStorage:
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = path.with_name(f"{path.name}.{timestamp}.bak")
-        shutil.copy2(path, backup_path)
+        if backup_path.exists():
+            if os.path.samefile(path, backup_path):
+                return backup_path  # same-second backup of this exact file
+            backup_path.unlink()
+        try:
+            # save_json replaces the file by rename, so the old inode is never written
+            # again and a hardlink is as good as a copy, without copying any bytes.
+            os.link(path, backup_path)
+        except OSError:
+            shutil.copy2(path, backup_path)
         self._cleanup_old_backups(path, keep=3)
         return backup_path
 
     def _cleanup_old_backups(self, file_path: Path, *, keep: int = 3) -> None:
-        pattern = f"{file_path.name}.*.bak"
-        backups = sorted(file_path.parent.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
-        for old in backups[keep:]:
+        # Backup names embed a zero-padded %Y%m%d_%H%M%S stamp, so sorting by name is
+        # chronological and needs no per-file stat() call.
+        prefix = f"{file_path.name}."
+        with os.scandir(file_path.parent) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(".bak")
+            ]
+        names.sort(reverse=True)
+        for old in (file_path.parent / name for name in names[keep:]):
             try:
                 old.unlink()
             except OSError as exc:
@@ -97,6 +300,8 @@ class FileStorage:
 
     def _restore_backup(self, backup_path: Path, target_path: Path) -> None:
         try:
+            if target_path.exists() and os.path.samefile(backup_path, target_path):
+                return  # hardlinked backup: the target was never replaced
             shutil.copy2(backup_path, target_path)
             self.logger.info("Restored backup %s after failed save.", backup_path)
         except OSError as exc:
@@ -129,6 +129,39 @@ class TestSougouWeChatFetcher(unittest.TestCase):
         self.assertEqual("招标项目B", articles[1]["title"])
         self.assertTrue(articles[0]["publish_date"].startswith("20"))
 
+    def test_fetch_article_list_deduplicates_overlapping_pages(self) -> None:
+        now = int(time.time())
+
+        def item(name: str) -> dict:
+            return {"title": f"招标{name}", "link": f"https://example.com/{name}", "create_time": now}
+
+        responses = {
+            0: {"base_resp": {"ret": 0}, "app_msg_list": [item("u1"), item("u2")]},
+            5: {"base_resp": {"ret": 0}, "app_msg_list": [item("u2"), item("u3"), item("u4")]},
+        }
+        fetcher = self._build_fetcher(FakeSession(responses))
+        articles = fetcher.fetch_article_list(max_articles=3)
+        self.assertEqual(
+            ["https://example.com/u1", "https://example.com/u2", "https://example.com/u3"],
+            [article["url"] for article in articles],
+        )
+
+    def test_match_keywords_treats_keywords_literally(self) -> None:
+        self.config["wechat"]["keyword_filters"] = ["C++", "采购"]
+        fetcher = self._build_fetcher(FakeSession({}))
+        self.assertTrue(fetcher._match_keywords("C++ 开发服务"))
+        self.assertTrue(fetcher._match_keywords("办公用品采购"))
+        self.assertFalse(fetcher._match_keywords("CC 开发服务"))
+
+        fetcher.keyword_filters = ["维保"]
+        self.assertTrue(fetcher._match_keywords("设备维保服务"))
+        self.assertFalse(fetcher._match_keywords("办公用品采购"))
+
+        fetcher.keyword_filters = ["C++", "采购"]
+        fetcher.keyword_logic = "AND"
+        self.assertFalse(fetcher._match_keywords("C++ 开发服务"))
+        self.assertTrue(fetcher._match_keywords("C++ 开发服务采购"))
+
     def test_returns_empty_when_wechat_session_invalid(self) -> None:
         responses = {
             0: {
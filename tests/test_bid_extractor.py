@@ -1,16 +1,19 @@
-import json
 import unittest
 from pathlib import Path
 
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - stdlib json also accepts bytes
+    import json as _json
+
 from core.bid_extractor import BidInfoExtractor
+from core.parsers.default_parser import DefaultParser
 
 
 class TestBidInfoExtractor(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
-        article_path = Path("wechat_article.json")
-        with article_path.open("r", encoding="utf-8") as fp:
-            cls.sample_article = json.load(fp)
+        cls.sample_article = _json.loads(Path("wechat_article.json").read_bytes())
         cls.sample_text = cls.sample_article["content_text"]
 
     def setUp(self) -> None:
@@ -55,5 +58,18 @@ class TestBidInfoExtractor(unittest.TestCase):
         self.assertEqual([], bids)
 
 
+class TestDefaultParserPatterns(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parser = DefaultParser()
+
+    def test_value_may_span_lines(self) -> None:
+        text = "采购内容：第一行\n第二行\n项目编号：A-1"
+        self.assertEqual("第一行\n第二行", self.parser._extract_field(self.parser.patterns["content"], text))
+
+    def test_long_value_without_boundary_gives_up(self) -> None:
+        text = "项目名称：" + "x" * (DefaultParser._MAX_VALUE_CHARS + 1000)
+        self.assertEqual("", self.parser._extract_field(self.parser.patterns["project_name"], text))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utils.config_loader import _find_file, dump_config, invalidate_config_cache, load_config
+
+
+class TestLoadConfigCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.base_path = Path(self.tmpdir.name) / "base.json"
+        # A name that never exists in the working directory, so only tmpdir is searched.
+        self.custom_name = "loader-test-override.json"
+        dump_config(self.base_path, {"scraper": {"wait_time": 1}})
+
+    def tearDown(self) -> None:
+        invalidate_config_cache()
+        self.tmpdir.cleanup()
+
+    def _load(self) -> dict:
+        return load_config(self.base_path, custom_name=self.custom_name)
+
+    def test_callers_get_independent_copies(self) -> None:
+        first = self._load()
+        first["scraper"]["wait_time"] = 99
+        self.assertEqual(1, self._load()["scraper"]["wait_time"])
+
+    def test_edited_file_is_reloaded(self) -> None:
+        self.assertEqual(1, self._load()["scraper"]["wait_time"])
+        self.base_path.write_text('{"scraper": {"wait_time": 25}}', encoding="utf-8")
+        self.assertEqual(25, self._load()["scraper"]["wait_time"])
+
+    def test_dump_config_invalidates_new_override_files(self) -> None:
+        self.assertEqual(1, self._load()["scraper"]["wait_time"])
+        dump_config(self.base_path.with_name(self.custom_name), {"scraper": {"wait_time": 7}})
+        self.assertEqual(7, self._load()["scraper"]["wait_time"])
+
+    def test_hand_created_override_is_picked_up(self) -> None:
+        self.assertEqual(1, self._load()["scraper"]["wait_time"])
+        override = self.base_path.with_name(self.custom_name)
+        override.write_text('{"scraper": {"wait_time": 3}}', encoding="utf-8")
+        self.assertEqual(3, self._load()["scraper"]["wait_time"])
+
+    def test_case_mismatch_defers_to_the_file_system(self) -> None:
+        wanted = self.base_path.with_name("BASE.json")
+        # Case-sensitive file systems report no such file; case-insensitive ones resolve it.
+        with mock.patch.object(Path, "is_file", return_value=False):
+            self.assertIsNone(_find_file(wanted))
+        with mock.patch.object(Path, "is_file", return_value=True):
+            self.assertEqual(wanted, _find_file(wanted))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,64 +1,226 @@
+import copy
+import logging
+import os
+import stat
 import tempfile
 import unittest
+from unittest import mock
 from pathlib import Path
 
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
 from core.data_manager import DataManager
-from core.database import Database
+from core.database import Database, session_scope
+from models.bid_record import BidRecord
+from models.wechat_account import WeChatAccount
+from storage import file_storage
 from storage.file_storage import FileStorage
 from utils.config_loader import dump_config
 
 
-class TestFileStorage(unittest.TestCase):
-    def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        self.storage = FileStorage()
-        self.data_path = Path(self.tmpdir.name) / "data.json"
+def null_logger(test: unittest.TestCase) -> logging.Logger:
+    """Return a per-class logger that never opens a log file."""
+    logger = logging.getLogger(f"test.{type(test).__name__}")
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+    return logger
+
+
+class SharedTmpDirMixin:
+    """Create one scratch directory per class and give each test its own subdirectory."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._class_tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._class_tmpdir.cleanup()
+        super().tearDownClass()
+
+    def make_test_dir(self) -> Path:
+        path = Path(self._class_tmpdir.name) / self._testMethodName
+        path.mkdir()
+        return path
 
-    def tearDown(self) -> None:
-        self.tmpdir.cleanup()
+
+class TestFileStorage(SharedTmpDirMixin, unittest.TestCase):
+    def setUp(self) -> None:
+        self.storage = FileStorage(logger=null_logger(self))
+        self.data_path = self.make_test_dir() / "data.json"
+
+    def _sidecars(self) -> dict:
+        """Group the names of files next to data.json by suffix in one directory scan."""
+        groups: dict = {".bak": [], ".corrupt": [], ".tmp": []}
+        with os.scandir(self.data_path.parent) as entries:
+            for entry in entries:
+                bucket = groups.get(os.path.splitext(entry.name)[1])
+                if bucket is not None:
+                    bucket.append(entry.name)
+        return groups
 
     def test_load_missing_returns_empty_list(self) -> None:
         self.assertEqual([], self.storage.load_json(self.data_path))
 
+    @unittest.skipUnless(hasattr(os, "fchmod"), "POSIX file modes only")
+    def test_saved_file_mode_follows_umask(self) -> None:
+        previous = os.umask(0o077)
+        try:
+            mode = file_storage._umask_file_mode()
+        finally:
+            os.umask(previous)
+        self.assertEqual(0o600, mode)
+        with mock.patch.object(file_storage, "_FILE_MODE", mode):
+            self.storage.save_json(self.data_path, [{"id": 1}])
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(self.data_path).st_mode))
+
     def test_save_creates_backup_on_overwrite(self) -> None:
         self.assertTrue(self.storage.save_json(self.data_path, [{"id": 1}]))
-        self.assertEqual(0, len(list(self.data_path.parent.glob("data.json.*.bak"))))
+        self.assertEqual([], self._sidecars()[".bak"])
 
         self.assertTrue(self.storage.save_json(self.data_path, [{"id": 2}]))
-        backups = list(self.data_path.parent.glob("data.json.*.bak"))
-        self.assertEqual(1, len(backups))
+        self.assertEqual(1, len(self._sidecars()[".bak"]))
+
+    def test_unchanged_save_skips_write_and_backup(self) -> None:
+        self.assertTrue(self.storage.save_json(self.data_path, [{"id": 1}]))
+        self.assertTrue(self.storage.save_json(self.data_path, [{"id": 1}]))
+        self.assertEqual([], self._sidecars()[".bak"])
+
+        self.data_path.write_text("[]", encoding="utf-8")  # external change
+        self.assertTrue(self.storage.save_json(self.data_path, [{"id": 1}]))
+        self.assertEqual([{"id": 1}], self.storage.load_json(self.data_path))
+
+    def test_backup_survives_overwrite(self) -> None:
+        self.assertTrue(self.storage.save_json(self.data_path, [{"id": 1}]))
+        backup = self.storage.backup_file(self.data_path)
+        self.assertTrue(self.storage.save_json(self.data_path, [{"id": 2}]))
+        self.assertEqual([{"id": 1}], self.storage.load_json(backup))
+        self.assertEqual([{"id": 2}], self.storage.load_json(self.data_path))
+
+    def test_cleanup_keeps_newest_backups_by_name(self) -> None:
+        self.data_path.write_text("[]", encoding="utf-8")
+        for stamp in ("20250101_000000", "20250301_000000", "20250201_000000", "20250401_000000"):
+            self.data_path.with_name(f"data.json.{stamp}.bak").write_text("[]", encoding="utf-8")
+        self.storage._cleanup_old_backups(self.data_path, keep=3)
+        remaining = sorted(self._sidecars()[".bak"])
+        self.assertEqual(
+            [
+                "data.json.20250201_000000.bak",
+                "data.json.20250301_000000.bak",
+                "data.json.20250401_000000.bak",
+            ],
+            remaining,
+        )
+
+    def test_every_sync_mode_round_trips(self) -> None:
+        payload = [{"id": 1, "name": "招标公告"}]
+        for mode in FileStorage.SYNC_MODES:
+            with self.subTest(mode=mode):
+                storage = FileStorage(logger=null_logger(self), sync_mode=mode)
+                self.assertTrue(storage.save_json(self.data_path, payload))
+                self.assertEqual(payload, storage.load_json(self.data_path))
+                self.assertEqual([], self._sidecars()[".tmp"])
+        with self.assertRaises(ValueError):
+            FileStorage(logger=null_logger(self), sync_mode="sometimes")
+
+    def test_save_leaves_no_temp_file_and_keeps_mode(self) -> None:
+        self.assertTrue(self.storage.save_json(self.data_path, [{"id": 1}]))
+        self.assertEqual(["data.json"], [p.name for p in self.data_path.parent.iterdir()])
+        if os.name == "posix":
+            self.assertEqual(file_storage._FILE_MODE, self.data_path.stat().st_mode & 0o777)
+
+    def test_save_is_compact_unless_pretty(self) -> None:
+        payload = [{"id": 1, "name": "招标"}]
+        self.storage.save_json(self.data_path, payload)
+        self.assertEqual('[{"id":1,"name":"招标"}]', self.data_path.read_text(encoding="utf-8"))
+
+        FileStorage(logger=null_logger(self), pretty=True).save_json(self.data_path, payload)
+        self.assertIn('\n  {\n    "id": 1,', self.data_path.read_text(encoding="utf-8"))
+        self.assertEqual(payload, self.storage.load_json(self.data_path))
+
+    def test_load_json_reuses_parse_until_file_changes(self) -> None:
+        self.storage.save_json(self.data_path, [{"id": 1, "status": "new"}])
+        first = self.storage.load_json(self.data_path)
+        first[0]["status"] = "mutated"
+        first.append({"id": 2})
+        self.assertEqual([{"id": 1, "status": "new"}], self.storage.load_json(self.data_path))
+
+        self.data_path.write_text('[{"id": 3}]', encoding="utf-8")
+        self.assertEqual([{"id": 3}], self.storage.load_json(self.data_path))
+
+    def test_load_json_stream_filters_items(self) -> None:
+        payload = [{"id": 1, "status": "new", "score": 1.5}, {"id": 2, "status": "done"}]
+        self.storage.save_json(self.data_path, payload)
+        is_new = lambda item: item["status"] == "new"  # noqa: E731
+        matches = list(self.storage.load_json_stream(self.data_path, is_new))
+        self.assertEqual([payload[0]], matches)
+        self.assertIsInstance(matches[0]["score"], float)
+        self.assertEqual(payload, list(self.storage.load_json_stream(self.data_path)))
+        missing = self.data_path.with_name("missing.json")
+        self.assertEqual([], list(self.storage.load_json_stream(missing, is_new)))
+
+    def test_load_json_stream_reuses_cache_and_streams_large_files(self) -> None:
+        payload = [{"id": 1, "status": "new"}, {"id": 2, "status": "done"}]
+        self.storage.save_json(self.data_path, payload)
+        is_new = lambda item: item["status"] == "new"  # noqa: E731
+        self.storage.load_json(self.data_path)
+        with mock.patch.object(Path, "open", side_effect=AssertionError("file re-read")):
+            self.assertEqual([payload[0]], list(self.storage.load_json_stream(self.data_path, is_new)))
+
+        uncached = FileStorage(logger=null_logger(self))
+        uncached.STREAM_MIN_BYTES = 0  # take the incremental parse path
+        self.assertEqual([payload[0]], list(uncached.load_json_stream(self.data_path, is_new)))
 
     def test_corrupt_file_is_quarantined(self) -> None:
         self.data_path.write_text("{bad json", encoding="utf-8")
         result = self.storage.load_json(self.data_path)
         self.assertEqual([], result)
         self.assertFalse(self.data_path.exists())
-        quarantined = list(self.data_path.parent.glob("data.json.*.corrupt"))
-        self.assertEqual(1, len(quarantined))
+        sidecars = self._sidecars()
+        self.assertEqual(1, len(sidecars[".corrupt"]))
+        self.assertEqual([], sidecars[".bak"])
+
+
+class InMemoryFileStorage:
+    """Stand-in for ``FileStorage`` that keeps JSON lists in a dict instead of on disk."""
+
+    def __init__(self) -> None:
+        self._data: dict = {}
+        self._versions: dict = {}
+
+    def cache_key(self, file_path: Path):
+        path = Path(file_path)
+        return self._versions[path] if path in self._data else None
+
+    def load_json(self, file_path: Path) -> list:
+        return copy.deepcopy(self._data.get(Path(file_path), []))
+
+    def load_json_stream(self, file_path: Path, predicate=None):
+        return filter(predicate, self.load_json(file_path))
+
+    def save_json(self, file_path: Path, data: list) -> bool:
+        path = Path(file_path)
+        self._data[path] = copy.deepcopy(data)
+        self._versions[path] = self._versions.get(path, 0) + 1
+        return True
 
 
-class TestDataManager(unittest.TestCase):
+class TestDataManager(SharedTmpDirMixin, unittest.TestCase):
     def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        tmp_path = Path(self.tmpdir.name)
-        shared_log_dir = Path("data/logs").resolve()
-        shared_log_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.make_test_dir()
         config = {
             "paths": {
                 "data_dir": str(tmp_path / "data"),
-                "log_dir": str(shared_log_dir),
+                "log_dir": str(tmp_path / "logs"),
             }
         }
-        self.config_path = tmp_path / "config.yml"
+        self.config_path = tmp_path / "config.json"
         dump_config(self.config_path, config)
-        self.manager = DataManager(str(self.config_path))
-
-    def tearDown(self) -> None:
-        if hasattr(self, "manager"):
-            for handler in list(self.manager.logger.handlers):
-                handler.close()
-                self.manager.logger.removeHandler(handler)
-        self.tmpdir.cleanup()
+        self.manager = DataManager(
+            str(self.config_path), storage=InMemoryFileStorage(), logger=null_logger(self)
+        )
 
     def _sample_bid(self, suffix: int, **overrides) -> dict:
         bid = {
@@ -73,13 +235,14 @@ class TestDataManager(unittest.TestCase):
         return bid
 
     def test_save_bids_deduplicates(self) -> None:
-        bid = self._sample_bid(1)
-        self.assertEqual(1, len(self.manager.save_bids([bid])))
-        self.assertEqual(0, len(self.manager.save_bids([bid])))
+        # Preseed the "already saved" state instead of paying for a first save round trip.
+        self.manager.storage.save_json(self.manager.bids_file, [self._sample_bid(1)])
+        created = self.manager.save_bids([self._sample_bid(1), self._sample_bid(2)])
+        self.assertEqual(["bid-2"], [bid["id"] for bid in created])
 
         stored = self.manager.get_all_bids()
-        self.assertEqual(1, len(stored))
-        self.assertEqual("bid-1", stored[0]["id"])
+        self.assertEqual({"bid-1", "bid-2"}, {bid["id"] for bid in stored})
+        self.assertEqual(2, len(stored))
 
     def test_get_bids_by_status(self) -> None:
         bids = [
@@ -102,6 +265,13 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(1, len(stored))
         self.assertEqual("notified", stored[0]["status"])
 
+    def test_update_bid_statuses_in_bulk(self) -> None:
+        self.manager.save_bids([self._sample_bid(1), self._sample_bid(2), self._sample_bid(3)])
+        updated = self.manager.update_bid_statuses(["bid-1", "bid-3", "missing"], "notified")
+        self.assertEqual(2, updated)
+        notified = {bid["id"] for bid in self.manager.get_all_bids(status="notified")}
+        self.assertEqual({"bid-1", "bid-3"}, notified)
+
     def test_article_save_and_deduplication(self) -> None:
         article = {
             "url": "https://example.com/article-1",
@@ -109,10 +279,35 @@ class TestDataManager(unittest.TestCase):
             "author": "Tester",
             "publish_time": "2025-11-25",
         }
-        self.assertTrue(self.manager.save_article(article))
+        self.manager.storage.save_json(self.manager.articles_file, [article])
         self.assertFalse(self.manager.save_article(article))
+        self.assertTrue(self.manager.save_article(dict(article, url="https://example.com/article-2")))
         self.assertTrue(self.manager.is_article_crawled(article["url"]))
 
+    def test_article_dedup_sees_other_instances_writes(self) -> None:
+        self.assertTrue(self.manager.save_article({"url": "https://example.com/a"}))
+        other = DataManager(
+            str(self.config_path), storage=self.manager.storage, logger=self.manager.logger
+        )
+        self.assertTrue(other.save_article({"url": "https://example.com/b"}))
+        self.assertTrue(self.manager.is_article_crawled("https://example.com/b"))
+        self.manager.reset_data()
+        self.assertFalse(self.manager.is_article_crawled("https://example.com/a"))
+
+    def test_article_index_is_keyed_on_shared_file_storage(self) -> None:
+        storage = FileStorage(logger=self.manager.logger)
+        first, second = (
+            DataManager(str(self.config_path), storage=storage, logger=self.manager.logger)
+            for _ in range(2)
+        )
+        url = "https://example.com/shared"
+        self.assertFalse(second.is_article_crawled(url))
+        self.assertTrue(first.save_article({"url": url}))
+        self.assertTrue(second.is_article_crawled(url))
+        with mock.patch.object(storage, "load_json", side_effect=AssertionError("rescanned")):
+            self.assertTrue(second.is_article_crawled(url))
+            self.assertFalse(second.save_article({"url": url}))
+
     def test_stats_summary(self) -> None:
         self.manager.save_article({"url": "https://a.com"})
         self.manager.save_article({"url": "https://b.com"})
@@ -133,38 +328,65 @@ class TestDataManager(unittest.TestCase):
 
 
 class TestDataManagerDatabase(unittest.TestCase):
-    def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        tmp_path = Path(self.tmpdir.name)
-        log_dir = Path(self.tmpdir.name) / "logs"
+    """Shares one SQLite schema; each test runs inside a transaction rolled back afterwards."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        tmp_path = Path(cls.tmpdir.name)
+        log_dir = tmp_path / "logs"
         log_dir.mkdir(parents=True, exist_ok=True)
-        self.db_path = tmp_path / "bids.sqlite"
-        self.config = {
+        cls.config = {
             "paths": {
                 "data_dir": str(tmp_path / "data"),
                 "log_dir": str(log_dir),
             },
             "database": {
                 "enabled": True,
-                "url": f"sqlite:///{self.db_path}",
+                "url": "sqlite://",  # in-memory: no database file, no fsync
             },
         }
-        self.config_path = tmp_path / "config.yml"
-        dump_config(self.config_path, self.config)
-        self.database = Database(self.config)
-        self.database.create_tables()
+        cls.config_path = tmp_path / "config.json"
+        dump_config(cls.config_path, cls.config)
+        cls.database = Database(cls.config)
+        engine = cls.database.get_engine()
+
+        # pysqlite defers BEGIN and mishandles SAVEPOINT; let SQLAlchemy drive transactions.
+        @event.listens_for(engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, _record) -> None:
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _emit_begin(connection) -> None:
+            connection.exec_driver_sql("BEGIN")
+
+        cls.database.create_tables()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.database.get_engine().dispose()
+        cls.tmpdir.cleanup()
+
+    def setUp(self) -> None:
+        self.connection = self.database.get_engine().connect()
+        self.transaction = self.connection.begin()
+        # Session commits/rollbacks become SAVEPOINT operations inside the outer transaction.
+        self.session_factory = sessionmaker(
+            bind=self.connection,
+            autoflush=False,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
         self.manager = DataManager(
             str(self.config_path),
             config=self.config,
-            db_session_factory=self.database.get_session_factory(),
+            db_session_factory=self.session_factory,
+            logger=null_logger(self),
         )
 
     def tearDown(self) -> None:
-        if hasattr(self, "manager"):
-            for handler in list(self.manager.logger.handlers):
-                handler.close()
-                self.manager.logger.removeHandler(handler)
-        self.tmpdir.cleanup()
+        self.transaction.rollback()
+        self.connection.close()
 
     def _sample_bid(self, suffix: int, **overrides) -> dict:
         payload = {
@@ -178,6 +400,18 @@ class TestDataManagerDatabase(unittest.TestCase):
         payload.update(overrides)
         return payload
 
+    @staticmethod
+    def _sample_account(account_id: str, **overrides) -> dict:
+        payload = {
+            "id": account_id,
+            "name": account_id,
+            "fakeid": "fakeid",
+            "token": "token",
+            "cookie": "cookie",
+        }
+        payload.update(overrides)
+        return payload
+
     def test_bid_crud_in_database(self) -> None:
         bid = self._sample_bid(1)
         created = self.manager.save_bids([bid])
@@ -189,6 +423,82 @@ class TestDataManagerDatabase(unittest.TestCase):
         stored = self.manager.get_all_bids(status="notified")
         self.assertEqual(1, len(stored))
 
+    def test_save_bids_skips_existing_and_repeated_ids_in_one_batch(self) -> None:
+        self.manager.save_bids([self._sample_bid(1)])
+        created = self.manager.save_bids(
+            [self._sample_bid(1), self._sample_bid(2), self._sample_bid(2), {"project_name": "x"}]
+        )
+        self.assertEqual(["db-bid-2"], [bid["id"] for bid in created])
+        self.assertEqual(2, self.manager.get_stats()["total_bids"])
+
+    def test_bulk_status_update_in_database(self) -> None:
+        self.manager.save_bids([self._sample_bid(1), self._sample_bid(2)])
+        self.assertEqual(2, self.manager.update_bid_statuses(["db-bid-1", "db-bid-2"], "archived"))
+        self.assertEqual(2, len(self.manager.get_all_bids(status="archived")))
+
+    def test_bulk_create_inserts_rows_in_one_commit(self) -> None:
+        session = self.session_factory()
+        try:
+            payloads = [
+                dict(self._sample_bid(index), extracted_time="2025-12-01T00:00:00+00:00")
+                for index in range(1, 4)
+            ]
+            self.assertEqual(3, BidRecord.bulk_create(session, payloads))
+            self.assertEqual(0, BidRecord.bulk_create(session, []))
+        finally:
+            session.close()
+        self.assertEqual(3, self.manager.get_stats()["total_bids"])
+
+    def test_account_changes_can_share_one_transaction(self) -> None:
+        session = self.session_factory()
+        try:
+            WeChatAccount.create(session, self._sample_account("acc-1"), commit=False)
+            WeChatAccount.create(session, self._sample_account("acc-2"), commit=False)
+            WeChatAccount.update(session, "acc-1", {"name": "Renamed"}, commit=False)
+            self.assertTrue(WeChatAccount.delete(session, "acc-2", commit=False))
+            session.rollback()
+            self.assertEqual([], WeChatAccount.get_all(session))
+
+            WeChatAccount.create(session, self._sample_account("acc-3"), commit=False)
+            WeChatAccount.update(session, "acc-3", {"name": "Renamed"}, commit=False)
+            session.commit()
+            self.assertEqual(["Renamed"], [acc.name for acc in WeChatAccount.get_all(session)])
+        finally:
+            session.close()
+
+    def test_account_bulk_upsert_inserts_and_updates(self) -> None:
+        rows = [self._sample_account("acc-1"), self._sample_account("acc-2")]
+        session = self.session_factory()
+        try:
+            self.assertEqual(2, WeChatAccount.bulk_upsert(session, rows))
+            loaded = WeChatAccount.get_by_id(session, "acc-2")
+            self.assertEqual([], loaded.to_dict()["filter_keywords"])
+
+            rows[1] = self._sample_account("acc-2", name="Renamed", filter_keywords=["招标"])
+            rows.append(self._sample_account("acc-3"))
+            self.assertEqual(3, WeChatAccount.bulk_upsert(session, rows))
+            self.assertEqual(["招标"], loaded.to_dict()["filter_keywords"])
+            accounts = {acc.id: acc.to_dict() for acc in WeChatAccount.get_all(session)}
+        finally:
+            session.close()
+        self.assertEqual(["acc-1", "acc-2", "acc-3"], sorted(accounts))
+        self.assertEqual("Renamed", accounts["acc-2"]["name"])
+        self.assertEqual(["招标"], accounts["acc-2"]["filter_keywords"])
+
+    def test_account_non_list_keywords_decode_as_empty(self) -> None:
+        for raw in ("null", '"招标"', "{bad"):
+            account = WeChatAccount(id="acc-1", name="Account", filter_keywords=raw)
+            self.assertEqual([], account.to_dict()["filter_keywords"])
+
+    def test_session_scope_rolls_back_on_error(self) -> None:
+        factory = self.session_factory
+        with self.assertRaises(RuntimeError):
+            with session_scope(factory) as session:
+                WeChatAccount.create(session, self._sample_account("acc-1"), commit=False)
+                raise RuntimeError("boom")
+        with session_scope(factory) as session:
+            self.assertIsNone(WeChatAccount.get_by_id(session, "acc-1"))
+
     def test_article_and_stats_in_database(self) -> None:
         article = {
             "url": "https://db-example.com/a",
@@ -1,12 +1,15 @@
+import logging
+import shutil
 import tempfile
 import unittest
+from functools import lru_cache
 from pathlib import Path
+from unittest import mock
 
 from app import CrawlRunner
 from core.bid_extractor import BidInfoExtractor
 from core.data_manager import DataManager
 from utils.config_loader import dump_config
-from utils.logger import setup_logger
 
 
 SAMPLE_TEXT = """
@@ -29,6 +32,10 @@ SAMPLE_TEXT = """
 
 
 class FakeFetcher:
+    def __init__(self, *args, **kwargs):
+        # Stands in for SougouWeChatFetcher, which MultiSourceCrawler builds per account.
+        pass
+
     def fetch_article_list(self, max_articles=50):
         return [
             {"url": "https://example.com/a", "title": "Article A"},
@@ -53,6 +60,29 @@ class FakeScraper:
         return articles
 
 
+class CachingBidInfoExtractor(BidInfoExtractor):
+    """Memoise extract_from_text; FakeScraper returns SAMPLE_TEXT for every URL."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.cached_extract = lru_cache(maxsize=16)(self._extract_uncached)
+
+    def _extract_uncached(self, text: str, url: str, title: str, source_name: str) -> tuple:
+        # The key holds every article field the parsers read.
+        metadata = {"url": url, "title": title, "source_account_name": source_name}
+        return tuple(super().extract_from_text(text, metadata))
+
+    def extract_from_text(self, text, article_meta=None):
+        metadata = article_meta or {}
+        bids = self.cached_extract(
+            text,
+            str(metadata.get("url", "")),
+            str(metadata.get("title", "")),
+            metadata.get("source_account_name", "default"),
+        )
+        return [dict(bid) for bid in bids]  # callers may edit bids; keep the cache intact
+
+
 class FakeNotifier:
     def __init__(self):
         self.calls = []
@@ -67,17 +97,22 @@ class FakeNotifier:
 
 
 class CrawlRunnerIntegrationTest(unittest.TestCase):
-    def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        self.data_dir = Path(self.tmpdir.name) / "data"
-        self.log_dir = Path(self.tmpdir.name) / "logs"
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
-
-        self.config_path = Path(self.tmpdir.name) / "config.yml"
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.data_dir = Path(cls.tmpdir.name) / "data"
+        cls.log_dir = Path(cls.tmpdir.name) / "logs"
+        cls.log_dir.mkdir(parents=True, exist_ok=True)
+
+        cls.config_path = Path(cls.tmpdir.name) / "config.json"
         config = {
-            "paths": {"data_dir": str(self.data_dir), "log_dir": str(self.log_dir)},
-            "wechat": {"account_name": "测试号", "max_articles_per_crawl": 3},
+            "paths": {"data_dir": str(cls.data_dir), "log_dir": str(cls.log_dir)},
+            "wechat": {
+                "account_name": "测试号",
+                "max_articles_per_crawl": 3,
+                # MultiSourceCrawler only fetches from configured accounts.
+                "accounts": [{"id": "test", "name": "测试号", "fakeid": "FAKE", "token": "TOKEN"}],
+            },
             "email": {
                 "smtp_server": "smtp.test",
                 "smtp_port": 587,
@@ -87,28 +122,36 @@ class CrawlRunnerIntegrationTest(unittest.TestCase):
             },
             "scraper": {"headless": True},
         }
-        dump_config(self.config_path, config)
-        self.config = config
+        dump_config(cls.config_path, config)
+        cls.config = config
 
-        self.logger = setup_logger("IntegrationTest", log_dir=self.log_dir)
-        self.data_manager = DataManager(str(self.config_path))
+        # A NullHandler logger keeps the test from opening any log files.
+        cls.logger = logging.getLogger("test.IntegrationTest")
+        if not cls.logger.handlers:
+            cls.logger.addHandler(logging.NullHandler())
+        cls.data_manager = DataManager(str(cls.config_path), logger=cls.logger)
+        cls.extractor = CachingBidInfoExtractor(logger=cls.logger)
 
-    def tearDown(self) -> None:
-        for handler in list(self.data_manager.logger.handlers):
-            handler.close()
-            self.data_manager.logger.removeHandler(handler)
-        for handler in list(self.logger.handlers):
-            handler.close()
-            self.logger.removeHandler(handler)
-        self.tmpdir.cleanup()
+        cls._fetcher_patch = mock.patch("core.multi_source_crawler.SougouWeChatFetcher", FakeFetcher)
+        cls._fetcher_patch.start()
 
-    def test_runner_persists_bids_and_notifies(self):
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._fetcher_patch.stop()
+        cls.tmpdir.cleanup()
+
+    def setUp(self) -> None:
+        # Each test starts from an empty data directory; config and loggers are shared.
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+        self.data_dir.mkdir(parents=True)
+
+    def _run_crawl(self):
         runner = CrawlRunner(
             self.config,
             data_manager=self.data_manager,
             fetcher=FakeFetcher(),
             scraper=FakeScraper(),
-            extractor=BidInfoExtractor(logger=self.logger),
+            extractor=self.extractor,
             notifier=FakeNotifier(),
             logger=self.logger,
         )
@@ -119,10 +162,16 @@ class CrawlRunnerIntegrationTest(unittest.TestCase):
             status.update(kwargs)
 
         runner.run(status, update_status)
+        return runner, status
+
+    def test_runner_persists_bids_and_notifies(self):
+        runner, status = self._run_crawl()
 
         bids = self.data_manager.get_all_bids()
         self.assertGreaterEqual(len(bids), 2)
         self.assertEqual("notified", bids[0]["status"])
+        # Article B repeats A's projects, so only A's copies (and its URL) are kept.
+        self.assertEqual({"https://example.com/a"}, {bid["source_url"] for bid in bids})
 
         notifier = runner.notifier
         self.assertEqual(1, len(notifier.calls))
@@ -133,6 +182,15 @@ class CrawlRunnerIntegrationTest(unittest.TestCase):
 
         self.assertIn("爬取完成", status["message"])
 
+    def test_recrawl_after_reset_reuses_extraction(self):
+        self._run_crawl()
+        first = sorted(bid["id"] for bid in self.data_manager.get_all_bids())
+        self.data_manager.reset_data()
+
+        _, status = self._run_crawl()
+        self.assertIn("爬取完成", status["message"])
+        self.assertEqual(first, sorted(bid["id"] for bid in self.data_manager.get_all_bids()))
+        self.assertGreater(self.extractor.cached_extract.cache_info().hits, 0)
 
 if __name__ == "__main__":
     unittest.main()
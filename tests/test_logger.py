@@ -0,0 +1,34 @@
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+from utils.logger import _FILE_HANDLERS, _shared_file_handler
+
+
+class TestSharedFileHandler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.log_file = Path(self.tmpdir.name) / "app.log"
+        self.handler = _shared_file_handler(self.log_file)
+
+    def tearDown(self) -> None:
+        self.handler.close()
+        _FILE_HANDLERS.pop(self.log_file.resolve(), None)
+        self.tmpdir.cleanup()
+
+    def test_rollover_prunes_backups_beyond_thirty_days(self) -> None:
+        first = date(2020, 1, 1)
+        for offset in range(35):
+            name = f"app.log.{(first + timedelta(days=offset)):%Y%m%d}"
+            (self.log_file.parent / name).write_text("old\n", encoding="utf-8")
+
+        self.handler.doRollover()
+
+        backups = sorted(p.name for p in self.log_file.parent.glob("app.log.*"))
+        self.assertEqual(30, len(backups))
+        self.assertNotIn("app.log.20200101", backups)
+
+
+if __name__ == "__main__":
+    unittest.main()
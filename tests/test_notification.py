@@ -19,6 +19,7 @@ class DummySMTP:
         self.starttls_called = False
         self.login_calls = []
         self.sent_messages = []
+        self.last_html = None
         self.closed = False
         DummySMTP.instance = self
 
@@ -40,6 +41,11 @@ class DummySMTP:
 
     def send_message(self, message):
         self.sent_messages.append(message)
+        # Decode the HTML body once at send time so assertions compare plain strings.
+        for part in message.walk():
+            if part.get_content_type() == "text/html":
+                self.last_html = part.get_payload(decode=True).decode("utf-8")
+                break
 
 
 class DummyDataManager:
@@ -51,6 +57,16 @@ class DummyDataManager:
         return True
 
 
+class BulkDataManager(DummyDataManager):
+    def __init__(self):
+        super().__init__()
+        self.bulk_calls = []
+
+    def update_bid_statuses(self, bid_ids, status):
+        self.bulk_calls.append((list(bid_ids), status))
+        return len(bid_ids)
+
+
 class TestEmailNotificationService(unittest.TestCase):
     def setUp(self) -> None:
         self.tmpdir = tempfile.TemporaryDirectory()
@@ -134,14 +150,25 @@ class TestEmailNotificationService(unittest.TestCase):
         self.assertTrue(smtp_instance.starttls_called)
         self.assertEqual(("bot@example.com", "secret"), smtp_instance.login_calls[0])
         self.assertEqual(1, len(smtp_instance.sent_messages))
-        msg = smtp_instance.sent_messages[0]
-        html_part = None
-        for part in msg.walk():
-            if part.get_content_type() == "text/html":
-                html_part = part.get_payload(decode=True).decode("utf-8")
-                break
-        self.assertIsNotNone(html_part)
-        self.assertIn("测试项目1", html_part)
+        self.assertIsNotNone(smtp_instance.last_html)
+        self.assertIn("测试项目1", smtp_instance.last_html)
+
+    def test_send_bid_notification_uses_bulk_status_update(self) -> None:
+        service = EmailNotificationService(
+            config=self.config,
+            logger=self.logger,
+            smtp_class=DummySMTP,
+        )
+        bids = [
+            {"id": "bid-1", "project_name": "项目1"},
+            {"id": "", "project_name": "无ID项目"},
+            {"id": "bid-2", "project_name": "项目2"},
+        ]
+        manager = BulkDataManager()
+
+        self.assertTrue(service.send_bid_notification(bids, data_manager=manager))
+        self.assertEqual([(["bid-1", "bid-2"], "notified")], manager.bulk_calls)
+        self.assertEqual([], manager.updated)
 
 
 if __name__ == "__main__":
@@ -72,7 +72,7 @@ class PerformanceTestCase(unittest.TestCase):
         self.log_dir = Path(self.tmpdir.name) / "logs"
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.log_dir.mkdir(parents=True, exist_ok=True)
-        self.config_path = Path(self.tmpdir.name) / "config.yml"
+        self.config_path = Path(self.tmpdir.name) / "config.json"
         config = {
             "paths": {"data_dir": str(self.data_dir), "log_dir": str(self.log_dir)},
             "wechat": {"account_name": "性能测试号", "max_articles_per_crawl": 50},
@@ -100,7 +100,7 @@ class PerformanceTestCase(unittest.TestCase):
             data_manager=self.data_manager,
             fetcher=FastFetcher(count=50),
             scraper=FastScraper(SAMPLE_TEXT),
-            extractor=BidInfoExtractor(),
+            extractor=BidInfoExtractor(logger=self.data_manager.logger),
             notifier=NullNotifier(),
             logger=None,
         )
@@ -1,15 +1,19 @@
-import time
+import threading
 import unittest
+from datetime import datetime, timezone
 
-from core.scheduler import CrawlScheduler, SchedulerConfig
+from core.scheduler import CrawlScheduler, SchedulerConfig, SimpleCron
 
 
 class DummyController:
     def __init__(self) -> None:
         self.started = 0
         self.force_running = False
+        # Set on every start() attempt so tests can wait for a tick instead of sleeping.
+        self._tick_event = threading.Event()
 
     def start(self) -> bool:
+        self._tick_event.set()
         if self.force_running:
             return False
         self.started += 1
@@ -22,7 +26,7 @@ class CrawlSchedulerTest(unittest.TestCase):
         cfg = SchedulerConfig(enabled=True, interval_minutes=0.001)
         scheduler = CrawlScheduler(controller, cfg)
         scheduler.start()
-        time.sleep(0.2)
+        self.assertTrue(controller._tick_event.wait(timeout=2.0))
         scheduler.stop()
         self.assertGreaterEqual(controller.started, 1)
 
@@ -32,7 +36,9 @@ class CrawlSchedulerTest(unittest.TestCase):
         cfg = SchedulerConfig(enabled=True, interval_minutes=0.001)
         scheduler = CrawlScheduler(controller, cfg)
         scheduler.start()
-        time.sleep(0.05)
+        for _ in range(2):
+            self.assertTrue(controller._tick_event.wait(timeout=2.0))
+            controller._tick_event.clear()
         scheduler.stop()
         self.assertEqual(controller.started, 0)
 
@@ -43,6 +49,59 @@ class CrawlSchedulerTest(unittest.TestCase):
         wait = scheduler._next_interval_seconds()
         self.assertGreater(wait, 0)
 
+    def test_next_interval_uses_supplied_clock(self) -> None:
+        controller = DummyController()
+        cfg = SchedulerConfig(enabled=True, cron="0 7 * * *", timezone="UTC")
+        scheduler = CrawlScheduler(controller, cfg)
+        now = datetime(2025, 11, 25, 6, 30, tzinfo=timezone.utc)
+        self.assertEqual(1800, scheduler._next_interval_seconds(now))
+
+    def test_invalid_cron_is_parsed_once_and_falls_back(self) -> None:
+        controller = DummyController()
+        cfg = SchedulerConfig(enabled=True, cron="not a cron", timezone="UTC")
+        scheduler = CrawlScheduler(controller, cfg)
+        self.assertIsNone(scheduler._cron)
+        self.assertEqual(3600, scheduler._next_interval_seconds())
+
+
+class SimpleCronTest(unittest.TestCase):
+    def test_next_after_jumps_to_next_matching_fields(self) -> None:
+        now = datetime(2025, 11, 25, 8, 30, 15, tzinfo=timezone.utc)
+        self.assertEqual(
+            datetime(2025, 11, 26, 7, 0, tzinfo=timezone.utc),
+            SimpleCron("0 7 * * *").next_after(now),
+        )
+        self.assertEqual(
+            datetime(2025, 11, 25, 8, 35, tzinfo=timezone.utc),
+            SimpleCron("*/5 * * * *").next_after(now),
+        )
+        self.assertEqual(
+            datetime(2026, 2, 1, 0, 15, tzinfo=timezone.utc),
+            SimpleCron("15 0 1 2 *").next_after(now),
+        )
+
+    def test_get_shares_parsed_instances(self) -> None:
+        cron = SimpleCron.get("0 7 * * *")
+        self.assertIs(cron, SimpleCron.get(" 0 7 * * * "))
+        self.assertIsNot(cron, SimpleCron.get("0 8 * * *"))
+
+    def test_impossible_day_month_combination_is_rejected_at_parse_time(self) -> None:
+        with self.assertRaises(ValueError):
+            SimpleCron("0 0 31 2,4 *")
+        SimpleCron("0 0 31 2,3 *")
+        SimpleCron("0 0 29 2 *")
+
+    def test_next_after_finds_leap_day_more_than_a_year_away(self) -> None:
+        now = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        self.assertEqual(
+            datetime(2028, 2, 29, tzinfo=timezone.utc),
+            SimpleCron("0 0 29 2 *").next_after(now),
+        )
+
+    def test_next_after_rejects_unreachable_expression(self) -> None:
+        with self.assertRaises(ValueError):
+            SimpleCron("0 0 30 2 *").next_after(datetime(2025, 1, 1, tzinfo=timezone.utc))
+
 
 if __name__ == "__main__":
     unittest.main()
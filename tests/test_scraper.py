@@ -4,6 +4,8 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
+import requests
+
 from core.scraper import WeChatArticleScraper
 
 
@@ -27,18 +29,21 @@ class FakeDriver:
     def __init__(self, html=SAMPLE_HTML):
         self._page_source = html
         self.visited = []
+        self.scripts = []
+        self.async_scripts = []
         self.closed = False
 
     def get(self, url):
         self.visited.append(url)
 
-    def execute_script(self, script):
-        if "document.body.scrollHeight" in script:
-            return 1000
-        if "window.innerHeight" in script:
-            return 500
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
         return None
 
+    def execute_async_script(self, script, *args):
+        self.async_scripts.append(args)
+        return 2
+
     def quit(self):
         self.closed = True
 
@@ -51,8 +56,37 @@ class FakeDriver:
         self._page_source = value
 
 
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        return None
+
+
+class FakeSession:
+    def __init__(self, html=SAMPLE_HTML):
+        self.html = html
+        self.requested = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requested.append(url)
+        return FakeResponse(self.html)
+
+
 class TestWeChatArticleScraper(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Every test wants scraper waits neutralised, so patch once for the class.
+        cls._sleep_patch = mock.patch("core.scraper.time.sleep", return_value=None)
+        cls.sleep_mock = cls._sleep_patch.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._sleep_patch.stop()
+
     def setUp(self) -> None:
+        self.sleep_mock.reset_mock()
         self.tmpdir = tempfile.TemporaryDirectory()
         self.config = {
             "scraper": {
@@ -61,6 +95,7 @@ class TestWeChatArticleScraper(unittest.TestCase):
                 "retry_count": 3,
                 "retry_delay": 0,
                 "random_delay_range": [0, 0],
+                "static_fetch": False,
             },
             "paths": {
                 "log_dir": str(Path(self.tmpdir.name) / "logs"),
@@ -84,20 +119,19 @@ class TestWeChatArticleScraper(unittest.TestCase):
         self._scrapers.append(scraper)
         return scraper
 
-    @mock.patch("core.scraper.time.sleep", return_value=None)
-    def test_scrape_article_parses_basic_fields(self, _sleep) -> None:
+    def test_scrape_article_parses_basic_fields(self) -> None:
         scraper = self.make_scraper()
         with mock.patch.object(scraper, "_wait_for_content"):
             data = scraper.scrape_article("https://example.com/article")
         self.assertEqual("Sample Title", data["title"])
         self.assertEqual("Author", data["author"])
         self.assertIn("Paragraph 1", data["content_text"])
+        self.assertEqual(1, len(scraper.driver.async_scripts))  # one fused scroll call
+        self.assertEqual([], scraper.driver.scripts)  # no scrollHeight polling
         scraper.close()
 
-    @mock.patch("core.scraper.time.sleep", return_value=None)
-    def test_batch_scrape_invokes_callback(self, _sleep) -> None:
+    def test_batch_scrape_invokes_callback(self) -> None:
         scraper = self.make_scraper()
-        scraper._random_delay = lambda: None  # skip random wait
         results = []
 
         def callback(index, total, data):
@@ -119,8 +153,7 @@ class TestWeChatArticleScraper(unittest.TestCase):
         self.assertEqual(3, mock_retry.call_count)
         scraper.close()
 
-    @mock.patch("core.scraper.time.sleep", return_value=None)
-    def test_retry_logic_attempts_until_success(self, sleep_mock) -> None:
+    def test_retry_logic_attempts_until_success(self) -> None:
         scraper = self.make_scraper()
         scraper.scrape_article = mock.MagicMock(
             side_effect=[None, {"content_text": ""}, {"content_text": "ok"}]
@@ -128,9 +161,62 @@ class TestWeChatArticleScraper(unittest.TestCase):
         result = scraper._scrape_with_retry("https://example.com")
         self.assertEqual({"content_text": "ok"}, result)
         self.assertEqual(3, scraper.scrape_article.call_count)
-        self.assertEqual(2, sleep_mock.call_count)  # two waits before success
+        self.assertEqual(2, self.sleep_mock.call_count)  # two waits before success
         scraper.close()
 
+    def test_static_fetch_skips_browser_when_content_present(self) -> None:
+        config = dict(self.config, scraper=dict(self.config["scraper"], static_fetch=True))
+        session = FakeSession()
+        scraper = WeChatArticleScraper(
+            config=config,
+            driver_factory=lambda: FakeDriver(),
+            session=session,
+        )
+        self._scrapers.append(scraper)
+        data = scraper.scrape_article("https://example.com/static")
+        self.assertEqual("Sample Title", data["title"])
+        self.assertEqual("https://example.com/static", data["url"])
+        self.assertEqual(["https://example.com/static"], session.requested)
+        self.assertIsNone(scraper.driver)
+
+    def test_parallel_batch_uses_one_driver_per_worker(self) -> None:
+        self.config["scraper"]["max_workers"] = 2
+        drivers = []
+
+        def factory():
+            driver = FakeDriver()
+            drivers.append(driver)
+            return driver
+
+        scraper = WeChatArticleScraper(config=self.config, driver_factory=factory)
+        self._scrapers.append(scraper)
+        urls = [f"https://example.com/{i}" for i in range(4)]
+        seen = []
+        with mock.patch.object(WeChatArticleScraper, "_wait_for_content"), mock.patch.object(
+            requests.Session, "close", autospec=True
+        ) as session_close:
+            articles = scraper.scrape_articles_batch(
+                urls, callback=lambda index, total, data: seen.append(index)
+            )
+
+        self.assertEqual(urls, [article["url"] for article in articles])
+        self.assertEqual([1, 2, 3, 4], seen)
+        self.assertLessEqual(len(drivers), 2)
+        self.assertTrue(all(driver.closed for driver in drivers))
+        self.assertIsNone(scraper.driver)
+        # Each worker's own HTTP session is closed; the parent's stays open.
+        closed = [call.args[0] for call in session_close.call_args_list]
+        self.assertEqual(2, len(closed))
+        self.assertNotIn(scraper.session, closed)
+
+    def test_parse_html_extracts_paragraphs_once_and_keeps_inner_spacing(self) -> None:
+        html = (
+            '<div id="js_content"><p>Hello <b>world</b></p><p>  </p>'
+            '<section>Budget 10万元</section></div>'
+        )
+        data = WeChatArticleScraper.parse_html(html)
+        self.assertEqual(["Hello world", "Budget 10万元"], data["paragraphs"])
+
     def test_close_handles_missing_driver(self) -> None:
         scraper = self.make_scraper()
         driver = scraper.init_driver()
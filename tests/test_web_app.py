@@ -1,9 +1,24 @@
+import logging
 import tempfile
 import unittest
 from pathlib import Path
 
 from app import CrawlRunner, CrawlController, create_app
 
+_saved_handlers = []
+
+
+def setUpModule() -> None:
+    # setup_logger keeps a logger's existing handlers, so pre-seeding a NullHandler
+    # keeps every app built here off the log files; tests never assert on log output.
+    logger = logging.getLogger("WebApp")
+    _saved_handlers[:] = logger.handlers
+    logger.handlers = [logging.NullHandler()]
+
+
+def tearDownModule() -> None:
+    logging.getLogger("WebApp").handlers = list(_saved_handlers)
+
 
 class FakeDataManager:
     def __init__(self):
@@ -18,10 +33,13 @@ class FakeDataManager:
             "notified_bids": 1,
             "archived_bids": 0,
         }
+        self._by_status = {}
+        for bid in self.bids:
+            self._by_status.setdefault(bid["status"], []).append(bid)
 
     def get_all_bids(self, status=None):
         if status:
-            return [bid for bid in self.bids if bid["status"] == status]
+            return list(self._by_status.get(status, []))
         return list(self.bids)
 
     def get_stats(self):
@@ -39,33 +57,38 @@ class FakeCrawlRunner:
 
 
 class WebAppTestCase(unittest.TestCase):
-    def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        log_dir = Path(self.tmpdir.name) / "logs"
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        log_dir = Path(cls.tmpdir.name) / "logs"
         log_dir.mkdir(parents=True, exist_ok=True)
-        self.db_path = Path(self.tmpdir.name) / "webapp.sqlite"
-        self.config = {
+        cls.db_path = Path(cls.tmpdir.name) / "webapp.sqlite"
+        cls.config = {
             "paths": {"log_dir": str(log_dir)},
             "wechat": {"account_name": "测试号", "max_articles_per_crawl": 5},
-            "database": {"url": f"sqlite:///{self.db_path}"},
+            "database": {"url": f"sqlite:///{cls.db_path}"},
         }
-        self.data_manager = FakeDataManager()
-        self.runner = FakeCrawlRunner()
-        self.app = create_app(
-            config=self.config,
-            data_manager=self.data_manager,
-            crawl_runner=self.runner,
+        cls.data_manager = FakeDataManager()
+        cls.runner = FakeCrawlRunner()
+        cls.app = create_app(
+            config=cls.config,
+            data_manager=cls.data_manager,
+            crawl_runner=cls.runner,
             controller_executor=lambda func: func(),  # synchronous for tests
         )
-        self.client = self.app.test_client()
+        cls.client = cls.app.test_client()
+        cls.initial_status = dict(cls.app.config["CRAWL_CONTROLLER"].status)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmpdir.cleanup()
 
-    def tearDown(self) -> None:
-        logger = self.app.config.get("LOGGER")
-        if logger:
-            for handler in list(logger.handlers):
-                handler.close()
-                logger.removeHandler(handler)
-        self.tmpdir.cleanup()
+    def setUp(self) -> None:
+        # The app is shared across tests; only the crawl state is mutable.
+        self.runner.runs = 0
+        status = self.app.config["CRAWL_CONTROLLER"].status
+        status.clear()
+        status.update(self.initial_status)
 
     def test_get_bids_filters_status(self):
         response = self.client.get("/api/bids?status=new")
@@ -99,35 +122,32 @@ class WebAppTestCase(unittest.TestCase):
 
 
 class WebAppDatabaseTestCase(unittest.TestCase):
-    def setUp(self) -> None:
-        self.tmpdir = tempfile.TemporaryDirectory()
-        log_dir = Path(self.tmpdir.name) / "logs"
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        log_dir = Path(cls.tmpdir.name) / "logs"
         log_dir.mkdir(parents=True, exist_ok=True)
-        self.db_path = Path(self.tmpdir.name) / "accounts.db"
-        self.config = {
+        cls.db_path = Path(cls.tmpdir.name) / "accounts.db"
+        cls.config = {
             "paths": {"log_dir": str(log_dir)},
             "wechat": {"account_name": "测试号", "max_articles_per_crawl": 5},
             "database": {
-                "url": f"sqlite:///{self.db_path}",
+                "url": f"sqlite:///{cls.db_path}",
             },
         }
-        self.data_manager = FakeDataManager()
-        self.runner = FakeCrawlRunner()
-        self.app = create_app(
-            config=self.config,
-            data_manager=self.data_manager,
-            crawl_runner=self.runner,
+        cls.data_manager = FakeDataManager()
+        cls.runner = FakeCrawlRunner()
+        cls.app = create_app(
+            config=cls.config,
+            data_manager=cls.data_manager,
+            crawl_runner=cls.runner,
             controller_executor=lambda func: func(),
         )
-        self.client = self.app.test_client()
-
-    def tearDown(self) -> None:
-        logger = self.app.config.get("LOGGER")
-        if logger:
-            for handler in list(logger.handlers):
-                handler.close()
-                logger.removeHandler(handler)
-        self.tmpdir.cleanup()
+        cls.client = cls.app.test_client()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmpdir.cleanup()
 
     def test_wechat_account_crud_via_database(self):
         response = self.client.get("/api/sources/wechat")
@@ -1,15 +1,71 @@
 from __future__ import annotations
 
+import io
 import json
 import sys
 from copy import deepcopy
+from functools import lru_cache
 import os
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Optional
+from typing import Any, Iterable, Mapping, Optional, TextIO
 
 from core.default_config import default_config_copy
 from utils.config_migrator import migrate_to_v2
 
+try:  # orjson parses bytes directly in C, several times faster than json
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib parser
+    orjson = None
+
+try:  # libyaml's C loader is far faster than the line-based fallback parser below
+    import yaml
+except ImportError:  # pragma: no cover - fall back to the built-in parser
+    yaml = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+if yaml is not None:
+
+    class _ConfigYamlDumper(yaml.SafeDumper):
+        """Indent block sequences so written files stay readable by the fallback parser."""
+
+        def increase_indent(self, flow=False, indentless=False):
+            return super().increase_indent(flow, False)
+
+    class _ConfigYamlLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+        """Safe loader whose scalar rules match the fallback parser's."""
+
+    def _construct_null(loader, node):
+        # A bare ``key:`` opens an empty mapping, as in the fallback parser.
+        return {} if node.value == "" else None
+
+    def _construct_bool(loader, node):
+        # Only true/false are booleans; YAML 1.1 yes/no/on/off stay strings.
+        value = loader.construct_scalar(node)
+        lowered = value.lower()
+        return lowered == "true" if lowered in {"true", "false"} else value
+
+    def _number_constructor(construct):
+        def _construct(loader, node):
+            value = loader.construct_scalar(node)
+            # No YAML 1.1 sexagesimal numbers: "7:30" stays a string.
+            return value if ":" in value else construct(loader, node)
+
+        return _construct
+
+    _ConfigYamlLoader.add_constructor("tag:yaml.org,2002:null", _construct_null)
+    _ConfigYamlLoader.add_constructor("tag:yaml.org,2002:bool", _construct_bool)
+    _ConfigYamlLoader.add_constructor(
+        "tag:yaml.org,2002:int", _number_constructor(yaml.SafeLoader.construct_yaml_int)
+    )
+    _ConfigYamlLoader.add_constructor(
+        "tag:yaml.org,2002:float", _number_constructor(yaml.SafeLoader.construct_yaml_float)
+    )
+    # Dates are kept as the strings the rest of the config code expects.
+    _ConfigYamlLoader.add_constructor(
+        "tag:yaml.org,2002:timestamp", yaml.SafeLoader.construct_scalar
+    )
+
 
 def load_config(base_path: str | Path, *, custom_name: str = "custom.yml") -> dict[str, Any]:
     """
@@ -19,45 +75,109 @@ def load_config(base_path: str | Path, *, custom_name: str = "custom.yml") -> di
     3. Optional custom overrides (custom.yml/custom.json) placed next to the binary/script.
     
     Auto-migrates old single-account format to new multi-account format.
+
+    Results are memoised per base path, custom name, config environment variables
+    and working directory. An entry is rebuilt once one of its source files changes
+    or a higher-priority candidate file appears (e.g. a hand-written custom.yml), and
+    every caller receives its own deep copy.
     """
+    key = (
+        str(base_path),
+        custom_name,
+        os.environ.get("QIXIAOFU_CONFIG_JSON"),
+        os.environ.get("QIXIAOFU_CONFIG_PATH"),
+        os.getcwd(),
+    )
+    config, sources = _load_config_cached(*key)
+    if any(_file_key(path) != stamp for path, stamp in sources):
+        _load_config_cached.cache_clear()
+        config, sources = _load_config_cached(*key)
+    return deepcopy(config)
+
+
+def invalidate_config_cache() -> None:
+    """Drop memoised configs so the next ``load_config`` re-reads from disk."""
+    _load_config_cached.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(
+    base_path: str,
+    custom_name: str,
+    env_json: Optional[str],
+    env_path: Optional[str],
+    _cwd: str,
+) -> tuple[dict[str, Any], tuple[tuple[Path, Optional[tuple[int, int]]], ...]]:
     config = default_config_copy()
+    sources: list[tuple[Path, Optional[tuple[int, int]]]] = []
+
+    def merge_file(path: Path) -> dict[str, Any]:
+        sources.append((path, _file_key(path)))
+        return _deep_merge_into(config, _load_structured_file(path))
 
-    env_json = os.environ.get("QIXIAOFU_CONFIG_JSON")
-    env_path = os.environ.get("QIXIAOFU_CONFIG_PATH")
     if env_json:
-        config = _deep_merge(config, json.loads(env_json))
+        config = _deep_merge_into(config, _parse_env_json(env_json))
     elif env_path:
         path = Path(env_path)
         if not path.exists():
             raise FileNotFoundError(f"Environment config path '{env_path}' not found.")
-        config = _deep_merge(config, _load_structured_file(path))
+        config = merge_file(path)
 
-    base_file = _find_file(Path(base_path))
+    # Candidates probed before a hit (or all of them, on a miss) are recorded as
+    # absent, so creating one of them invalidates this entry.
+    missing: list[Path] = []
+    base_file = _find_file(Path(base_path), missing=missing)
     base_dir = None
     if base_file:
-        config = _deep_merge(config, _load_structured_file(base_file))
+        config = merge_file(base_file)
         base_dir = base_file.parent
 
-    custom_file = _find_file(Path(custom_name), extra_dirs=_candidate_dirs(base_dir))
+    custom_file = _find_file(
+        Path(custom_name), extra_dirs=_candidate_dirs(base_dir), missing=missing
+    )
     if custom_file:
-        config = _deep_merge(config, _load_structured_file(custom_file))
-    
-    config = migrate_to_v2(config)
-    
-    return config
+        config = merge_file(custom_file)
+
+    absent = {os.path.normcase(os.path.abspath(path)): path for path in missing}
+    sources.extend((path, None) for path in absent.values())
+
+    return migrate_to_v2(config), tuple(sources)
+
+
+@lru_cache(maxsize=4)
+def _parse_env_json(raw: str) -> Mapping[str, Any]:
+    # Survives _load_config_cached being cleared when a config file changes; read-only
+    # like the file parse cache, since _deep_merge_into copies what it keeps.
+    return _json_loads(raw)
+
+
+def _file_key(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
 def _candidate_dirs(base_dir: Optional[Path]) -> list[Path]:
     dirs = []
     if base_dir:
         dirs.append(base_dir)
-    exe_dir = Path(sys.argv[0]).resolve().parent
-    dirs.append(exe_dir)
+    dirs.append(_exe_dir())
     dirs.append(Path.cwd())
     return dirs
 
 
-def _find_file(path: Path, *, extra_dirs: Iterable[Path] = ()) -> Optional[Path]:
+@lru_cache(maxsize=1)
+def _exe_dir() -> Path:
+    # sys.argv[0] does not change, so resolve it once. The cwd can, so it is not cached.
+    return Path(sys.argv[0]).resolve().parent
+
+
+def _find_file(
+    path: Path, *, extra_dirs: Iterable[Path] = (), missing: Optional[list[Path]] = None
+) -> Optional[Path]:
+    """Return the first existing candidate for ``path``; absent ones go to ``missing``."""
     candidates: list[Path] = []
     if path.is_absolute():
         candidates.append(path)
@@ -74,49 +194,91 @@ def _find_file(path: Path, *, extra_dirs: Iterable[Path] = ()) -> Optional[Path]
         candidates.append(Path(meipass) / path.name)
         candidates.extend(_alternate_paths(Path(meipass) / path.name))
 
-    exe_dir = Path(sys.argv[0]).resolve().parent
+    exe_dir = _exe_dir()
+    cwd = Path.cwd()
     candidates.append(exe_dir / path.name)
-    candidates.append(Path.cwd() / path.name)
+    candidates.append(cwd / path.name)
     candidates.extend(_alternate_paths(exe_dir / path.name))
-    candidates.extend(_alternate_paths(Path.cwd() / path.name))
+    candidates.extend(_alternate_paths(cwd / path.name))
 
-    seen: set[Path] = set()
+    # Candidates cluster in a handful of directories, so list each directory once and
+    # test names against that listing instead of stat-ing every candidate path. A name
+    # that differs only in case is confirmed with a stat, since case-insensitive file
+    # systems (macOS, Windows) resolve it and case-sensitive ones do not.
+    listings: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
     for candidate in candidates:
-        try:
-            resolved = candidate.resolve()
-        except OSError:
-            resolved = candidate
-        if resolved in seen:
-            continue
-        seen.add(resolved)
-        if candidate.exists() and candidate.is_file():
+        directory = os.fspath(candidate.parent)
+        listing = listings.get(directory)
+        if listing is None:
+            listing = listings[directory] = _file_names(candidate.parent)
+        exact, folded = listing
+        name = candidate.name
+        if name in exact or (name.casefold() in folded and candidate.is_file()):
             return candidate
+        if missing is not None:
+            missing.append(candidate)
     return None
 
 
-def _deep_merge(base: Mapping[str, Any], overrides: Mapping[str, Any]) -> dict[str, Any]:
-    merged = deepcopy(base)
-    for key, value in overrides.items():
-        if (
-            key in merged
-            and isinstance(merged[key], Mapping)
-            and isinstance(value, Mapping)
-        ):
-            merged[key] = _deep_merge(merged[key], value)
-        else:
-            merged[key] = deepcopy(value)
-    return merged
+def _file_names(directory: Path) -> tuple[frozenset[str], frozenset[str]]:
+    """Return the names of regular files in ``directory``, as listed and casefolded."""
+    try:
+        with os.scandir(directory) as entries:
+            names = frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset(), frozenset()
+    return names, frozenset(name.casefold() for name in names)
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _deep_merge_into(target: dict[str, Any], overrides: Mapping[str, Any]) -> dict[str, Any]:
+    """Merge ``overrides`` into ``target`` in place and return it.
+
+    Nested mappings are merged key by key and scalars are assigned directly; only
+    other containers (lists) are deep-copied, so the read-only parse cache is never
+    shared with the result.
+    """
+    # Walk nested sections with an explicit work-list rather than recursion, so
+    # arbitrarily deep user configs cannot hit the recursion limit.
+    pending = [(target, overrides)]
+    while pending:
+        dest, source = pending.pop()
+        for key, value in source.items():
+            # Leaves are mostly scalars and parsed sections are plain dicts; test those
+            # concrete types first so the abstract Mapping check is rarely reached.
+            if isinstance(value, _SCALAR_TYPES):
+                dest[key] = value
+            elif isinstance(value, dict) or isinstance(value, Mapping):
+                current = dest.get(key)
+                if not isinstance(current, dict):
+                    current = dest[key] = {}
+                pending.append((current, value))
+            else:
+                dest[key] = deepcopy(value)
+    return target
 
 
 def _load_structured_file(path: Path) -> Mapping[str, Any]:
+    """Parse a config file, reusing the previous result while the file is unchanged."""
+    stat = path.stat()
+    return _load_structured_file_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_structured_file_cached(path_str: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    # mtime_ns/size are only part of the cache key so edits to the file invalidate the entry.
+    # Callers must treat the result as read-only; _deep_merge_into copies what it keeps.
+    path = Path(path_str)
     suffix = path.suffix.lower()
-    with path.open("r", encoding="utf-8") as fp:
-        if suffix in {".yml", ".yaml"}:
-            data = _yaml_safe_load(fp.read()) or {}
-        elif suffix == ".json":
-            data = json.load(fp)
-        else:
-            raise ValueError(f"Unsupported config format: {path}")
+    if suffix not in {".yml", ".yaml", ".json"}:
+        raise ValueError(f"Unsupported config format: {path}")
+    raw = path.read_bytes()  # one read; orjson and libyaml both parse UTF-8 bytes directly
+    if suffix == ".json":
+        data = _json_loads(raw)
+    else:
+        data = _yaml_safe_load(raw) or {}
     if not isinstance(data, Mapping):
         raise ValueError(f"Configuration file {path} must contain a mapping.")
     return data
@@ -128,10 +290,19 @@ def dump_config(path: Path, data: Mapping[str, Any]) -> None:
     if suffix in {".yml", ".yaml"}:
         _dump_yaml(path, data)
     elif suffix == ".json":
-        with path.open("w", encoding="utf-8") as fp:
-            json.dump(data, fp, ensure_ascii=False, indent=2)
+        path.write_bytes(_json_dumps_pretty(data))
     else:
         raise ValueError(f"Unsupported config format: {path}")
+    invalidate_config_cache()
+
+
+def _json_dumps_pretty(data: Mapping[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. non-str keys; let the stdlib encoder handle or report it
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 def _alternate_paths(path: Path) -> list[Path]:
@@ -147,7 +318,7 @@ def _alternate_paths(path: Path) -> list[Path]:
 
 
 def read_config_file(path: Path) -> Mapping[str, Any]:
-    return _load_structured_file(path)
+    return deepcopy(_load_structured_file(path))
 
 
 class _YamlNode:
@@ -166,7 +337,15 @@ class _YamlNode:
         self.can_convert = can_convert
 
 
-def _yaml_safe_load(text: str) -> Mapping[str, Any]:
+def _yaml_safe_load(text: str | bytes) -> Mapping[str, Any]:
+    if yaml is not None:
+        return yaml.load(text, Loader=_ConfigYamlLoader)
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    return _simple_yaml_load(text)
+
+
+def _simple_yaml_load(text: str) -> Mapping[str, Any]:
     root = _YamlNode(-1, {}, None, None, False)
     stack = [root]
     for raw_line in text.splitlines():
@@ -234,7 +413,7 @@ def _parse_scalar(value: str) -> Any:
         return None
     if value[0] in "[{":
         try:
-            return json.loads(value)
+            return _json_loads(value)
         except Exception:
             pass
     try:
@@ -247,31 +426,40 @@ def _parse_scalar(value: str) -> Any:
 
 
 def _dump_yaml(path: Path, data: Mapping[str, Any]) -> None:
-    lines = _yaml_dump_lines(data, indent=0)
-    with path.open("w", encoding="utf-8") as fp:
-        fp.write("\n".join(lines) + "\n")
+    if yaml is not None:
+        text = yaml.dump(
+            data,
+            Dumper=_ConfigYamlDumper,
+            allow_unicode=True,
+            sort_keys=False,
+            default_flow_style=False,
+            width=float("inf"),  # never fold long strings such as user agents
+        )
+    else:
+        buffer = io.StringIO()
+        _write_yaml(buffer, data, indent=0)
+        text = buffer.getvalue()
+    path.write_text(text, encoding="utf-8")
 
 
-def _yaml_dump_lines(value: Any, indent: int) -> list[str]:
-    lines: list[str] = []
+def _write_yaml(fp: TextIO, value: Any, indent: int) -> None:
     prefix = " " * indent
     if isinstance(value, Mapping):
         for key, val in value.items():
             if isinstance(val, (Mapping, list)):
-                lines.append(f"{prefix}{key}:")
-                lines.extend(_yaml_dump_lines(val, indent + 2))
+                fp.write(f"{prefix}{key}:\n")
+                _write_yaml(fp, val, indent + 2)
             else:
-                lines.append(f"{prefix}{key}: {_format_scalar(val)}")
+                fp.write(f"{prefix}{key}: {_format_scalar(val)}\n")
     elif isinstance(value, list):
         for item in value:
             if isinstance(item, (Mapping, list)):
-                lines.append(f"{prefix}-")
-                lines.extend(_yaml_dump_lines(item, indent + 2))
+                fp.write(f"{prefix}-\n")
+                _write_yaml(fp, item, indent + 2)
             else:
-                lines.append(f"{prefix}- {_format_scalar(item)}")
+                fp.write(f"{prefix}- {_format_scalar(item)}\n")
     else:
-        lines.append(f"{prefix}{_format_scalar(value)}")
-    return lines
+        fp.write(f"{prefix}{_format_scalar(value)}\n")
 
 
 def _format_scalar(value: Any) -> str:
@@ -5,6 +5,11 @@ from __future__ import annotations
 from typing import Any, Dict
 import re
 
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+# Single-account keys that move into the account entry instead of staying on ``wechat``.
+_MIGRATED_KEYS = frozenset({"fakeid", "token", "cookie", "account_name", "page_size", "days_limit"})
+
 
 def migrate_to_v2(config: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -21,7 +26,7 @@ def migrate_to_v2(config: Dict[str, Any]) -> Dict[str, Any]:
     
     wechat = config.get("wechat", {})
     
-    # Check if already migrated
+    # Already migrated: hand the input back untouched
     if "accounts" in wechat:
         return config
     
@@ -55,23 +60,24 @@ def migrate_to_v2(config: Dict[str, Any]) -> Dict[str, Any]:
         
         # Preserve other fields that may exist
         for key, value in wechat.items():
-            if key not in ["fakeid", "token", "cookie", "account_name", "page_size", "days_limit"] and key not in new_wechat:
-                new_wechat[key] = value
+            if key not in _MIGRATED_KEYS:
+                new_wechat.setdefault(key, value)
         
-        config["wechat"] = new_wechat
+        config = {**config, "wechat": new_wechat}
     
     # Add bid_sites if not present
-    if "bid_sites" not in config:
-        config["bid_sites"] = []
+    config.setdefault("bid_sites", [])
     
     return config
 
 
 def _generate_account_id(name: str) -> str:
     """Generate a URL-safe ID from account name."""
-    # Remove non-alphanumeric characters and convert to lowercase
-    slug = re.sub(r'[^\w\s-]', '', name.lower())
-    slug = re.sub(r'[-\s]+', '-', slug).strip('-')
+    if name.isascii() and name.isalnum():
+        slug = name.lower()  # nothing to strip or collapse
+    else:
+        # Remove non-alphanumeric characters and convert to lowercase
+        slug = _SLUG_DASH.sub('-', _SLUG_STRIP.sub('', name.lower())).strip('-')
     
     # If empty or starts with number, prefix with 'account'
     if not slug or slug[0].isdigit():
@@ -1,5 +1,6 @@
 import logging
-from datetime import datetime
+import re
+from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
@@ -7,18 +8,15 @@ from utils.config_loader import load_config
 
 __all__ = ["setup_logger"]
 
-_CONFIG_CACHE: Optional[Dict[str, Any]] = None
+_FORMATTER = logging.Formatter("[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s")
+# One rotating file handler per log file, shared by every logger writing to it.
+_FILE_HANDLERS: Dict[Path, logging.Handler] = {}
 
 
 def _load_config(config_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
-    """Load configuration from JSON once and cache the result."""
-    global _CONFIG_CACHE
-    if _CONFIG_CACHE is not None:
-        return _CONFIG_CACHE
-
+    """Load configuration; ``load_config`` memoises the parsed result."""
     path = Path(config_path) if config_path else Path(__file__).resolve().parents[1] / "config.yml"
-    _CONFIG_CACHE = load_config(path)
-    return _CONFIG_CACHE
+    return load_config(path)
 
 
 def _get_log_level(level: Optional[Union[int, str]]) -> int:
@@ -61,18 +59,32 @@ def setup_logger(
     if logger.handlers:
         return logger
 
-    log_file = default_log_dir / f"{datetime.now().strftime('%Y%m%d')}.log"
-    formatter = logging.Formatter("[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s")
-
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
-    file_handler.setLevel(resolved_level)
-    file_handler.setFormatter(formatter)
-
     console_handler = logging.StreamHandler()
     console_handler.setLevel(resolved_level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
 
-    logger.addHandler(file_handler)
+    logger.addHandler(_shared_file_handler(default_log_dir / "app.log"))
     logger.addHandler(console_handler)
 
     return logger
+
+
+def _shared_file_handler(log_file: Path) -> logging.Handler:
+    """
+    Return the one rotating handler for ``log_file`` in this process.
+
+    Loggers share it because independent TimedRotatingFileHandlers on the same file
+    would each rename it at midnight and overwrite one another's rotated copy.
+    """
+    key = log_file.resolve()
+    handler = _FILE_HANDLERS.get(key)
+    if handler is None:
+        handler = TimedRotatingFileHandler(
+            key, when="midnight", backupCount=30, encoding="utf-8"
+        )
+        handler.suffix = "%Y%m%d"
+        # extMatch must agree with suffix, or backupCount never finds old files to delete.
+        handler.extMatch = re.compile(r"^\d{8}(\.\w+)?$", re.ASCII)
+        handler.setFormatter(_FORMATTER)
+        _FILE_HANDLERS[key] = handler
+    return handler